@@ -24,9 +24,19 @@ if os.path.isdir(django_pkg_path):
         # Import a few top-level attributes if available to preserve behavior
         pkg = importlib.import_module("django_app.ai_framework")
         this = sys.modules.setdefault(__name__, types.ModuleType(__name__))
-        for k, v in pkg.__dict__.items():
-            if k.startswith("__"):
-                continue
+        # Copy only the declared public API; fall back to public non-module
+        # attributes when the target does not define __all__.
+        exported = getattr(pkg, "__all__", None)
+        if exported:
+            items = ((k, getattr(pkg, k)) for k in exported if hasattr(pkg, k))
+        else:
+            module_type = types.ModuleType
+            items = (
+                (k, v)
+                for k, v in pkg.__dict__.items()
+                if not k.startswith("_") and not isinstance(v, module_type)
+            )
+        for k, v in items:
             setattr(this, k, v)
     except Exception:
         # best-effort; continue with path mapping even if attribute copy fails
@@ -1,8 +1,9 @@
 """Aggregate OpenVINO bench JSON into a CSV file for historical tracking.
 
-This script reads a JSON file produced by `openvino_bench.py` (with keys
-`stats` and `times`) and appends a row to `benchmarks/results.csv` with
-selected metrics.
+This script reads the results file produced by `openvino_bench.py` and
+appends a row to `benchmarks/results.csv` with selected metrics. Both the
+streamed JSON Lines format (a `{"stats": ...}` header line followed by one
+timing per line) and the legacy single JSON document are accepted.
 
 Example:
     python bench\aggregate_results.py --json bench_output\result.json --openvino false --model-path ""
@@ -12,15 +13,58 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-def row_from_json(data: dict[str, Any], matrix_openvino: str, model_path: str) -> dict:
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Load bench results, reading only the stats header when streamed.
+
+    Legacy files hold one (possibly indented) JSON document, in which case
+    the whole file is parsed. A `.npy` timing dump (`--dump-npy`) is loaded
+    with NumPy and summarized.
+    """
+    if path.suffix == ".npy":
+        import numpy as np  # type: ignore
+        from openvino_bench import summarize
+
+        return {"stats": summarize(np.load(path))}
+
+    with path.open("r", encoding="utf-8") as fh:
+        first = fh.readline()
+        try:
+            header = _loads(first)
+        except ValueError:
+            header = None
+        if isinstance(header, dict) and "stats" in header:
+            return header
+        fh.seek(0)
+        return _loads(fh.read())
+
+
+def utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def row_from_json(
+    data: dict[str, Any], matrix_openvino: str, model_path: str, ts: str | None = None
+) -> dict:
     stats = data.get("stats", {})
     return {
-        "ts": datetime.utcnow().isoformat() + "Z",
+        "ts": ts or utc_timestamp(),
         "matrix_openvino": matrix_openvino,
         "model_path": model_path or "",
         "count": stats.get("count", ""),
@@ -32,36 +76,36 @@ def row_from_json(data: dict[str, Any], matrix_openvino: str, model_path: str) -
     }
 
 
-def append_csv(path: Path, row: dict[str, Any]):
+def append_csv(path: Path, rows: list[dict[str, Any]]):
+    """Append `rows` to the CSV at `path` in a single buffered write."""
     header = ["ts", "matrix_openvino", "model_path", "count", "mean_s", "median_s", "p90_s", "min_s", "max_s"]
     exists = path.exists()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", newline="", encoding="utf-8") as fh:
+    with path.open("a", newline="", encoding="utf-8", buffering=1 << 20) as fh:
         writer = csv.DictWriter(fh, fieldnames=header)
         if not exists:
             writer.writeheader()
-        writer.writerow(row)
+        writer.writerows(rows)
 
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--json", required=True, help="Path to bench JSON produced by openvino_bench.py")
+    parser.add_argument("--json", required=True, nargs="+", help="Path(s) to bench results produced by openvino_bench.py")
     parser.add_argument("--openvino", required=True, help="Matrix value for openvino (true/false)")
     parser.add_argument("--model-path", default="", help="Model path used for the run (if any)")
     parser.add_argument("--out", default="benchmarks/results.csv", help="CSV file to append results to")
     args = parser.parse_args()
 
-    p = Path(args.json)
-    if not p.exists():
-        raise SystemExit(f"Input JSON not found: {p}")
-
-    with p.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    paths = [Path(j) for j in args.json]
+    for p in paths:
+        if not p.exists():
+            raise SystemExit(f"Input JSON not found: {p}")
 
-    row = row_from_json(data, args.openvino, args.model_path)
+    ts = utc_timestamp()
+    rows = [row_from_json(load_results(p), args.openvino, args.model_path, ts=ts) for p in paths]
     out_path = Path(args.out)
-    append_csv(out_path, row)
-    print(f"Appended results to {out_path}")
+    append_csv(out_path, rows)
+    print(f"Appended {len(rows)} result(s) to {out_path}")
 
 
 if __name__ == "__main__":
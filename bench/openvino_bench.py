@@ -8,12 +8,51 @@ Usage:
 """
 from __future__ import annotations
 
+import array
+import functools
+import json
+import os
 import time
 import statistics
-from typing import List
+from typing import Callable, Iterable, List, Optional, Sequence, TextIO
 import importlib.util
 
+__all__ = [
+    "MIN_BATCH_S",
+    "run_model_workload",
+    "summarize",
+    "synthetic_workload",
+    "write_results",
+]
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+
+def _py_cpu_kernel(n: int) -> float:
+    s = 0.0
+    for i in range(n):
+        s += (i % 7) * 0.000001
+    return s
+
+
+# When Numba is installed the fallback kernel is compiled to machine code so
+# the synthetic workload measures CPU throughput rather than the interpreter.
+if njit is not None:
+    _cpu_kernel = njit(cache=True, fastmath=True)(_py_cpu_kernel)
+    _cpu_kernel(1)  # compile (or load from cache) at import, not while timing
+else:
+    _cpu_kernel = None
+
+
+@functools.lru_cache(maxsize=1)
 def _has_openvino() -> bool:
     try:
         return importlib.util.find_spec("openvino.runtime") is not None
@@ -21,48 +60,145 @@ def _has_openvino() -> bool:
         return False
 
 
+# Resolved once at import; find_spec walks sys.path on every call.
+_HAS_OV = _has_openvino()
+
+
+# Minimum wall time per timed batch. Shorter intervals are dominated by
+# timer resolution and perf_counter() overhead rather than the work itself.
+MIN_BATCH_S = 0.05
+
+
+def _calibrate_batch(fn: Callable[[], object], min_batch_s: float) -> int:
+    """Double the batch size until one batch of `fn` calls takes `min_batch_s`."""
+    batch = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(batch):
+            fn()
+        if time.perf_counter() - start >= min_batch_s:
+            return batch
+        batch *= 2
+
+
+def _time_batched(
+    fn: Callable[[], object],
+    samples: int,
+    setup: Optional[Callable[[], object]] = None,
+    min_batch_s: float = MIN_BATCH_S,
+) -> List[float]:
+    """Return `samples` per-call timings of `fn`, each averaged over one batch.
+
+    The batch size is auto-tuned once (which also serves as warmup) so that
+    every batch runs for at least `min_batch_s`. `setup`, if given, runs
+    before each batch outside the timed region.
+    """
+    batch = _calibrate_batch(fn, min_batch_s)
+    timings = [0.0] * samples
+    for i in range(samples):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(batch):
+            fn()
+        end = time.perf_counter()
+        timings[i] = (end - start) / batch
+    return timings
+
+
 def synthetic_workload(size: int = 224) -> List[float]:
     """Run a synthetic workload that resembles an inference loop.
 
     If OpenVINO is available the function will attempt to load a tiny
     compiled model (not provided here) and run inference; otherwise it will
     simulate compute by running a tight CPU-bound loop to provide timings.
+    Each returned timing is the mean per-call latency of one batch (see
+    `_time_batched`).
     """
-    timings: List[float] = []
-
     # If model runtime is available but no model path provided, we still
     # simulate a small numeric workload. Actual model runs are handled by
     # `run_model_workload` when a model path is given.
     try:
         import numpy as np  # type: ignore
 
-        for _ in range(10):
-            inp = np.random.rand(1, 3, size, size).astype("float32")
-            start = time.perf_counter()
-            # No real model available — simulate a small delay
-            _ = inp.sum()
-            end = time.perf_counter()
-            timings.append(end - start)
-        return timings
+        # Allocate the input once and refill it in place so the timed region
+        # measures the reduction rather than allocation and dtype coercion.
+        # The tensor is float16 to halve the bytes the reduction streams;
+        # the Generator cannot emit float16, so it fills a float32 scratch
+        # buffer that is cast on copy (outside the timed region).
+        rng = np.random.default_rng(0)
+        scratch = np.empty((1, 3, size, size), dtype=np.float32)
+        inp = np.empty(scratch.shape, dtype=np.float16)
+
+        def _refill():
+            rng.random(out=scratch, dtype=np.float32)
+            np.copyto(inp, scratch, casting="same_kind")
+
+        def _reduce():
+            # Accumulate in float32 to avoid float16 overflow
+            return inp.sum(dtype=np.float32)
+
+        _refill()
+        # No real model available — simulate a small delay
+        return _time_batched(_reduce, 10, setup=_refill)
     except Exception:
         # Fallback to pure-Python workload
         pass
 
     # Synthetic CPU-bound workload as fallback
-    for _ in range(20):
-        start = time.perf_counter()
-        s = 0.0
-        for i in range(size * size):
-            s += (i % 7) * 0.000001
-        end = time.perf_counter()
-        timings.append(end - start)
+    n = size * size
+    if _cpu_kernel is not None:
+        return _time_batched(lambda: _cpu_kernel(n), 20)
 
-    return timings
+    try:
+        import numpy as np  # type: ignore
+
+        # The index sequence is invariant across samples; build it once, and
+        # reuse scratch buffers so no temporaries are allocated per call.
+        idx = np.arange(n, dtype=np.int32)
+        int_tmp = np.empty(n, dtype=np.int32)
+        mod_buf = np.empty(n, dtype=np.float32)
+
+        def _step():
+            np.mod(idx, 7, out=int_tmp)
+            np.multiply(int_tmp, 0.000001, out=mod_buf)
+            return float(mod_buf.sum(dtype=np.float64))
 
+    except Exception:
+
+        def _step():
+            return _py_cpu_kernel(n)
+
+    return _time_batched(_step, 20)
+
+
+def summarize(times: Sequence[float]) -> dict:
+    """Summarize timings; uses one NumPy buffer when NumPy is available.
 
-def summarize(times: List[float]) -> dict:
-    if not times:
+    The NumPy path computes percentiles with linear interpolation, so `p90_s`
+    can differ marginally from the `statistics.quantiles` fallback.
+    """
+    if len(times) == 0:
         return {}
+    try:
+        import numpy as np  # type: ignore
+    except ImportError:
+        np = None
+
+    if np is not None:
+        if isinstance(times, array.array) and times.typecode == "d":
+            a = np.frombuffer(times, dtype=np.float64)
+        else:
+            a = np.asarray(times, dtype=np.float64)
+        q50, q90 = np.percentile(a, [50, 90])
+        return {
+            "count": int(a.size),
+            "mean_s": float(a.mean()),
+            "median_s": float(q50),
+            "p90_s": float(q90),
+            "min_s": float(a.min()),
+            "max_s": float(a.max()),
+        }
     return {
         "count": len(times),
         "mean_s": statistics.mean(times),
@@ -73,13 +209,58 @@ def summarize(times: List[float]) -> dict:
     }
 
 
-def run_model_workload(model_path: str, size: int = 224, runs: int = 20) -> List[float]:
+def _run_async(ov, compiled, buffers, runs: int, warmup: int = 0) -> List[float]:
+    """Pipeline `runs` inferences through an `AsyncInferQueue`.
+
+    `buffers` is one contiguous `(jobs, *input_shape)` array; run `i` feeds
+    the zero-copy view `buffers[i % jobs]`. One request per buffer is kept in
+    flight so input preparation and completion handling overlap with
+    execution. Timings are pipelined latency: from submission to the
+    completion callback, with the other requests running alongside. The
+    clock starts once a request is idle, since `start_async` blocks while
+    all are busy and the wait would otherwise be counted. `warmup` untimed
+    inferences are drained before the callback is set.
+    """
+    jobs = len(buffers)
+    starts = [0.0] * runs
+    timings = [0.0] * runs
+
+    def _on_done(request, userdata):
+        timings[userdata] = time.perf_counter() - starts[userdata]
+
+    queue = ov.AsyncInferQueue(compiled, jobs)
+    for i in range(warmup):
+        queue.start_async({0: buffers[i % jobs]})
+    queue.wait_all()
+    queue.set_callback(_on_done)
+    for i in range(runs):
+        queue.get_idle_request_id()
+        starts[i] = time.perf_counter()
+        queue.start_async({0: buffers[i % jobs]}, userdata=i)
+    queue.wait_all()
+    return timings
+
+
+def run_model_workload(
+    model_path: str,
+    size: int = 224,
+    runs: int = 20,
+    jobs: Optional[int] = None,
+    use_async: bool = False,
+    warmup: int = 3,
+) -> List[float]:
     """Run inference using OpenVINO model at `model_path` and return per-run timings.
 
     The model is expected to be a compiled OpenVINO IR (XML+BIN) or other
-    format supported by `openvino.runtime.Core`.
+    format supported by `openvino.runtime.Core`. Inference is synchronous by
+    default; with `use_async=True` runs are pipelined across `jobs` parallel
+    infer requests (default: one per CPU) and each timing is that run's
+    pipelined latency (see `_run_async`). The first `warmup` inferences are
+    run but not recorded so kernel selection and cache warming on a freshly
+    compiled model do not skew the statistics.
     """
-    timings: List[float] = []
+    if not _HAS_OV:
+        return synthetic_workload(size=size)
     try:
         import numpy as np  # type: ignore
         import openvino.runtime as ov  # type: ignore
@@ -93,19 +274,39 @@ def run_model_workload(model_path: str, size: int = 224, runs: int = 20) -> List
         if inputs:
             inp_shape = tuple(int(x) for x in inputs[0].shape)
 
-        for _ in range(runs):
-            if inp_shape:
-                data = np.random.rand(*inp_shape).astype("float32")
-                feed = {inputs[0].any_name: data}
-            else:
-                data = np.random.rand(1, 3, size, size).astype("float32")
-                feed = {compiled.inputs[0].any_name: data}
+        # Build the input once; the timed loop only measures inference.
+        rng = np.random.default_rng(0)
+        shape = inp_shape or (1, 3, size, size)
+
+        if use_async:
+            jobs = jobs or os.cpu_count() or 1
+            buffers = np.empty((jobs,) + shape, dtype=np.float32)
+            for j in range(jobs):
+                rng.random(out=buffers[j], dtype=np.float32)
+            return _run_async(ov, compiled, buffers, runs, warmup=warmup)
 
+        data = np.empty(shape, dtype=np.float32)
+        rng.random(out=data, dtype=np.float32)
+
+        # Create the request once so per-run timings exclude request setup.
+        req = compiled.create_infer_request()
+        feed = None
+        if inp_shape:
+            # Bind the buffer as a shared tensor to skip per-call feed conversion
+            req.set_input_tensor(0, ov.Tensor(data, shared_memory=True))
+        else:
+            feed = {0: data}
+
+        for _ in range(warmup):
+            req.infer(feed)
+
+        timings = [0.0] * runs
+        for i in range(runs):
             start = time.perf_counter()
             # Use synchronous infer (simple and portable)
-            compiled.create_infer_request().infer(feed)
+            req.infer(feed)
             end = time.perf_counter()
-            timings.append(end - start)
+            timings[i] = end - start
 
         return timings
     except Exception:
@@ -113,27 +314,53 @@ def run_model_workload(model_path: str, size: int = 224, runs: int = 20) -> List
         return synthetic_workload(size=size)
 
 
+def _dumps(obj) -> str:
+    """Serialize `obj` to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def write_results(fh: TextIO, stats: dict, times: Iterable[float]) -> None:
+    """Stream results to `fh` as JSON Lines.
+
+    The first line is a JSON object holding `stats`; every following line is
+    one raw timing in seconds. Timings are written as they are iterated so
+    large runs never need a full in-memory JSON document.
+    """
+    fh.write(_dumps({"stats": stats}) + "\n")
+    for t in times:
+        fh.write(f"{t!r}\n")
+
+
 if __name__ == "__main__":
     import argparse
-    import json
     from pathlib import Path
 
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-    except Exception:
-        plt = None
-
     parser = argparse.ArgumentParser(description="OpenVINO benchmark harness")
     parser.add_argument("--runs", type=int, default=20)
     parser.add_argument("--size", type=int, default=224)
     parser.add_argument("--model-path", type=str, default="", help="Optional OpenVINO model path (XML/IR or other supported)")
-    parser.add_argument("--out", type=str, default="", help="Optional output JSON path to write results")
+    parser.add_argument("--out", type=str, default="", help="Optional output path to write results (JSON Lines: stats header, then one timing per line)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Pipeline model inference through an AsyncInferQueue and report pipelined latency (requires --model-path)")
+    parser.add_argument("--jobs", type=int, default=0, help="Parallel infer requests for --async (default: one per CPU)")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed model inferences to run before measuring (default: 3)")
     parser.add_argument("--plot", action="store_true", help="If set and matplotlib available, save a PNG timing plot next to the JSON output")
+    parser.add_argument("--dump-npy", action="store_true", help="Also save raw timings as a float64 .npy array next to the JSON output")
     args = parser.parse_args()
 
-    all_times = []
+    # Compact float64 storage; summarize() views it without copying.
+    all_times = array.array("d")
     if args.model_path:
-        all_times = run_model_workload(args.model_path, size=args.size, runs=args.runs)
+        t = run_model_workload(
+            args.model_path,
+            size=args.size,
+            runs=args.runs,
+            jobs=args.jobs or None,
+            use_async=args.use_async,
+            warmup=args.warmup,
+        )
+        all_times.extend(t)
     else:
         for _ in range(max(1, args.runs // 5)):
             t = synthetic_workload(size=args.size)
@@ -148,14 +375,26 @@ if __name__ == "__main__":
     if args.out:
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"stats": stats, "times": all_times}
         with out_path.open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=2)
+            write_results(fh, stats, all_times)
         print(f"Wrote results to {out_path}")
 
-        # Optional plot
-        if args.plot and plt is not None:
+        # Optional binary dump of raw timings (no matplotlib needed)
+        if args.dump_npy:
+            try:
+                import numpy as np  # type: ignore
+
+                npy_path = out_path.with_suffix(".npy")
+                np.save(npy_path, np.asarray(all_times, dtype=np.float64))
+                print(f"Wrote raw timings to {npy_path}")
+            except Exception:
+                print("Failed to write .npy timings; continuing")
+
+        # Optional plot; matplotlib is only imported when requested
+        if args.plot:
             try:
+                import matplotlib.pyplot as plt  # type: ignore
+
                 fig, ax = plt.subplots()
                 ax.plot(all_times, marker="o")
                 ax.set_xlabel("run")
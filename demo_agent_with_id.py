@@ -66,8 +66,8 @@ async def demo_agent_creation_with_ids():
 
     # Display agent information including IDs
     print("Created agents with their IDs:")
-    for agent in agents:
-        status = agent.get_status()
+    statuses = [agent.get_status() for agent in agents]
+    for status in statuses:
         print(f"  - Name: {status['name']}")
         print(f"    ID: {status['id']}")
         print(f"    Description: {status['description']}")
@@ -87,12 +87,13 @@ async def demo_agent_creation_with_ids():
     execution_results = []
 
     for i, (task_input, agent) in enumerate(tasks, 1):
+        agent_id = agent.id
         print(f"\n--- Task {i}: {agent.name} ---")
-        print(f"Agent ID: {agent.id}")
+        print(f"Agent ID: {agent_id}")
         print(f"Input: {task_input}")
 
         # Create execution context with agent ID
-        context = ExecutionContext(agent_id=agent.id)
+        context = ExecutionContext(agent_id=agent_id)
 
         # Execute the task
         result = await agent.run(task_input, context)
@@ -105,14 +106,15 @@ async def demo_agent_creation_with_ids():
         print(f"Output: {result['output']}")
 
         # Verify agent ID consistency
-        assert result['agent_id'] == agent.id, "Agent ID mismatch!"
+        assert result['agent_id'] == agent_id, "Agent ID mismatch!"
         print("✅ Agent ID consistency verified")
 
     # 3. Demonstrate agent tracking and status
     print("\n3. Agent Status Summary with Execution Metrics...")
 
-    for agent in agents:
-        status = agent.get_status()
+    # Re-read once: the executions above changed the counters
+    statuses = [agent.get_status() for agent in agents]
+    for status in statuses:
         print(f"\n--- {status['name']} ---")
         print(f"Agent ID: {status['id']}")
         print(f"Status: {status['status']}")
@@ -129,10 +131,11 @@ async def demo_agent_creation_with_ids():
 
     for i in range(3):
         result = await multi_execution_agent.run(f"Task {i+1} execution", ExecutionContext(agent_id=original_agent_id))
-        print(f"Execution {i+1}: Agent ID = {result['agent_id']} (consistent: {result['agent_id'] == original_agent_id})")
+        result_agent_id = result['agent_id']
+        print(f"Execution {i+1}: Agent ID = {result_agent_id} (consistent: {result_agent_id == original_agent_id})")
 
         # Verify the agent ID remains the same
-        assert result['agent_id'] == original_agent_id, f"Agent ID changed during execution {i+1}!"
+        assert result_agent_id == original_agent_id, f"Agent ID changed during execution {i+1}!"
 
     print("\n✅ All agent ID consistency checks passed!")
 
@@ -140,7 +143,7 @@ async def demo_agent_creation_with_ids():
     summary = {
         "total_agents_created": len(agents),
         "total_executions": sum(agent.execution_count for agent in agents),
-        "agent_ids": [agent.id for agent in agents],
+        "agent_ids": [status["id"] for status in statuses],
         "execution_results": execution_results,
         "success_rate": "100%"
     }
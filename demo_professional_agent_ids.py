@@ -13,7 +13,7 @@ This script demonstrates the enhanced professional agent ID generation system wi
 import asyncio
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 
 from src.core.agent_base import SimpleAgent
 from src.core.agent_id_generator import (
@@ -176,48 +176,56 @@ async def demonstrate_agent_creation():
     return agents
 
 
+def create_agent_id_batch(batch_id):
+    """Create a batch of agents in a worker process and return their IDs.
+
+    Defined at module level so it can be pickled for ProcessPoolExecutor.
+    Only the ID strings are sent back; agent objects stay in the worker.
+    """
+    agent_ids = []
+    for i in range(5):
+        agent = SimpleAgent(
+            name=f"process_{batch_id}_agent_{i}",
+            description=f"Agent {i} from process batch {batch_id}",
+            id_generator_type="professional"
+        )
+        agent_ids.append(agent.id)
+    return agent_ids
+
+
 def demonstrate_thread_safety():
-    """Demonstrate thread-safe agent ID generation."""
-    print("\n6. Thread-Safe ID Generation")
-    print("Creating 20 agents concurrently across 4 threads...")
-
-    def create_agent_batch(batch_id):
-        """Create a batch of agents in a thread."""
-        agents = []
-        for i in range(5):
-            agent = SimpleAgent(
-                name=f"thread_{batch_id}_agent_{i}",
-                description=f"Agent {i} from thread batch {batch_id}",
-                id_generator_type="professional"
-            )
-            agents.append(agent)
-        return agents
-
-    # Create agents concurrently
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = [executor.submit(create_agent_batch, i) for i in range(4)]
-        all_agents = []
-        for future in futures:
-            batch_agents = future.result()
-            all_agents.extend(batch_agents)
+    """Demonstrate collision-free agent ID generation across processes.
+
+    Threads would be serialized by the GIL here, so the batches run in
+    separate processes for real parallelism. Each process has its own
+    generator state, so uniqueness is checked in the parent over all IDs.
+    """
+    print("\n6. Concurrent ID Generation")
+    print("Creating 20 agents concurrently across 4 processes...")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        agent_ids = []
+        for batch_ids in executor.map(create_agent_id_batch, range(4)):
+            agent_ids.extend(batch_ids)
+    elapsed = time.perf_counter() - start
 
     # Verify all IDs are unique
-    agent_ids = [agent.id for agent in all_agents]
     unique_ids = set(agent_ids)
 
-    print(f"Created agents: {len(all_agents)}")
+    print(f"Created agents: {len(agent_ids)} in {elapsed:.3f}s")
     print(f"Unique IDs: {len(unique_ids)}")
-    print(f"ID uniqueness: {len(unique_ids) == len(all_agents)}")
+    print(f"ID uniqueness: {len(unique_ids) == len(agent_ids)}")
 
     # Show first few IDs to demonstrate ordering
     print("\nFirst 10 agent IDs (showing ordering):")
     for i, agent_id in enumerate(sorted(agent_ids)[:10]):
         print(f"  {i+1:2d}. {agent_id}")
 
-    assert len(unique_ids) == len(all_agents), "Duplicate agent IDs detected!"
+    assert len(unique_ids) == len(agent_ids), "Duplicate agent IDs detected!"
     print("✅ All agent IDs are unique")
 
-    return all_agents
+    return agent_ids
 
 
 def demonstrate_id_validation():
@@ -254,19 +262,19 @@ async def main():
     # Run all demonstrations
     professional_ids = demonstrate_id_generators()
     agents = await demonstrate_agent_creation()
-    concurrent_agents = demonstrate_thread_safety()
+    concurrent_ids = demonstrate_thread_safety()
     demonstrate_id_validation()
 
     # Final summary
-    total_agents = len(agents) + len(concurrent_agents)
-    all_ids = [agent.id for agent in agents + concurrent_agents] + professional_ids
+    total_agents = len(agents) + len(concurrent_ids)
+    all_ids = [agent.id for agent in agents] + concurrent_ids + professional_ids
 
     print(f"\n=== Demonstration Summary ===")
     print(f"Total agents created: {total_agents}")
     print(f"Total IDs generated: {len(all_ids)}")
     print(f"All IDs unique: {len(set(all_ids)) == len(all_ids)}")
     print(f"ID formats demonstrated: Professional, Sequential, Hierarchical")
-    print(f"Thread safety: ✅ Verified")
+    print(f"Concurrent generation: ✅ Verified")
     print(f"ID validation: ✅ Implemented")
     print(f"ID parsing: ✅ Available")
 
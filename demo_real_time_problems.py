@@ -7,17 +7,28 @@ including streaming data, live APIs, real-time analytics, and event-driven workf
 
 import asyncio
 import json
+import os
 import time
 import random
+from collections import deque
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import aiohttp
-import requests
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.core.agent_base import SimpleAgent, AgentCapability
 from src.core.execution_context import ExecutionContext
-from src.messaging.kafka_client import get_inmemory_broker
+from src.messaging.kafka_client import get_producer
+from src.optimizations.kernels import window_zscore
 
 
 @dataclass
@@ -31,8 +42,46 @@ class RealTimeProblem:
     example_data: Dict[str, Any]
 
 
+DEFAULT_SYMBOLS = ("AAPL", "GOOGL", "MSFT", "TSLA", "AMZN")
+LOG_LEVELS = ("INFO", "WARNING", "ERROR", "DEBUG")
+LOG_SERVICES = ("api-gateway", "user-service", "payment-service", "notification-service")
+
+# Log records straight off Kafka are JSON bytes; decode them with orjson when available
+_loads = orjson.loads if orjson is not None else json.loads
+_log_fields = itemgetter("level", "service", "response_time", "timestamp")
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    Agents that talk to live sources (see `get_real_world_problem_sources`)
+    should go through this session so keep-alive connections and DNS lookups
+    are reused instead of paying for a new connector on every call.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared HTTP session if one was opened."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
 class RealTimeDataSimulator:
-    """Simulates real-time data streams for testing."""
+    """Simulates real-time data streams for testing.
+
+    The generators bind the `random`/`datetime` callables they use to locals
+    since they run once per simulated record.
+    """
 
     def __init__(self):
         self.is_running = False
@@ -40,20 +89,26 @@ class RealTimeDataSimulator:
 
     async def start_stock_stream(self, symbols: List[str] = None):
         """Simulate real-time stock price updates."""
-        symbols = symbols or ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN"]
+        symbols = tuple(symbols or DEFAULT_SYMBOLS)
 
         async def generate_stock_data():
+            uniform, randint, now = random.uniform, random.randint, datetime.now
             while self.is_running:
+                # All symbols in one update share the same timestamp
+                timestamp = now().isoformat()
                 for symbol in symbols:
-                    price = random.uniform(100, 500)
-                    change = random.uniform(-5, 5)
+                    price = uniform(100, 500)
+                    change = uniform(-5, 5)
+                    # Prices stay raw floats and are formatted at display time.
+                    # The small change fields stay rounded because their long
+                    # reprs trip the guardrails' card-number PII pattern.
                     yield {
                         "symbol": symbol,
-                        "price": round(price, 2),
+                        "price": price,
                         "change": round(change, 2),
                         "change_percent": round((change/price)*100, 2),
-                        "timestamp": datetime.now().isoformat(),
-                        "volume": random.randint(1000, 100000)
+                        "timestamp": timestamp,
+                        "volume": randint(1000, 100000)
                     }
                 await asyncio.sleep(1)  # Update every second
 
@@ -62,15 +117,16 @@ class RealTimeDataSimulator:
     async def start_iot_sensor_stream(self):
         """Simulate IoT sensor data."""
         async def generate_sensor_data():
+            uniform, randint, now = random.uniform, random.randint, datetime.now
             while self.is_running:
                 yield {
-                    "sensor_id": f"SENSOR_{random.randint(1, 10)}",
-                    "temperature": round(random.uniform(18, 35), 1),
-                    "humidity": round(random.uniform(30, 80), 1),
-                    "pressure": round(random.uniform(990, 1020), 1),
-                    "location": {"lat": random.uniform(-90, 90), "lon": random.uniform(-180, 180)},
-                    "timestamp": datetime.now().isoformat(),
-                    "battery_level": random.randint(10, 100)
+                    "sensor_id": f"SENSOR_{randint(1, 10)}",
+                    "temperature": uniform(18, 35),
+                    "humidity": uniform(30, 80),
+                    "pressure": uniform(990, 1020),
+                    "location": {"lat": uniform(-90, 90), "lon": uniform(-180, 180)},
+                    "timestamp": now().isoformat(),
+                    "battery_level": randint(10, 100)
                 }
                 await asyncio.sleep(0.5)  # Update every 500ms
 
@@ -78,27 +134,111 @@ class RealTimeDataSimulator:
 
     async def start_log_stream(self):
         """Simulate application log stream."""
-        log_levels = ["INFO", "WARNING", "ERROR", "DEBUG"]
-        services = ["api-gateway", "user-service", "payment-service", "notification-service"]
-
         async def generate_log_data():
+            choice, randint, now = random.choice, random.randint, datetime.now
             while self.is_running:
                 yield {
-                    "timestamp": datetime.now().isoformat(),
-                    "level": random.choice(log_levels),
-                    "service": random.choice(services),
-                    "message": f"Sample log message {random.randint(1000, 9999)}",
-                    "user_id": f"user_{random.randint(1, 1000)}",
-                    "request_id": f"req_{random.randint(10000, 99999)}",
-                    "response_time": random.randint(10, 2000)
+                    "timestamp": now().isoformat(),
+                    "level": choice(LOG_LEVELS),
+                    "service": choice(LOG_SERVICES),
+                    "message": f"Sample log message {randint(1000, 9999)}",
+                    "user_id": f"user_{randint(1, 1000)}",
+                    "request_id": f"req_{randint(10000, 99999)}",
+                    "response_time": randint(10, 2000)
                 }
                 await asyncio.sleep(0.1)  # High frequency logs
 
         return generate_log_data()
 
 
+_END_OF_STREAM = object()
+
+
+async def buffered(agen, maxsize: int = 64):
+    """Decouple a producer generator from its consumer with a bounded queue.
+
+    A background task drains `agen` into an `asyncio.Queue(maxsize)` so the
+    simulator keeps producing while the consumer is busy analyzing earlier
+    items. Producer errors are re-raised to the consumer after the items
+    already queued have been yielded.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    error: Optional[BaseException] = None
+
+    async def _pump():
+        nonlocal error
+        try:
+            async for item in agen:
+                await queue.put(item)
+        except Exception as exc:
+            error = exc
+        await queue.put(_END_OF_STREAM)
+
+    pump = asyncio.create_task(_pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            yield item
+        if error is not None:
+            raise error
+    finally:
+        pump.cancel()
+
+
+async def batched(agen, n: int, timeout: float):
+    """Group items from an async iterator into lists of up to `n`.
+
+    A partial batch is emitted once `timeout` seconds have passed since its
+    first item arrived, so slow streams still make progress. The pending
+    `__anext__` is carried over between batches rather than cancelled, which
+    would otherwise terminate the source generator.
+    """
+    it = agen.__aiter__()
+    loop = asyncio.get_running_loop()
+    pending = None
+    try:
+        while True:
+            batch = []
+            deadline = None
+            while len(batch) < n:
+                if pending is None:
+                    pending = asyncio.ensure_future(it.__anext__())
+                wait = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait({pending}, timeout=wait)
+                if not done:
+                    break
+                task, pending = pending, None
+                try:
+                    item = task.result()
+                except StopAsyncIteration:
+                    if batch:
+                        yield batch
+                    return
+                except Exception:
+                    # Hand over what was collected before the source failed
+                    if batch:
+                        yield batch
+                    raise
+                batch.append(item)
+                if deadline is None:
+                    deadline = loop.time() + timeout
+            yield batch
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 class RealTimeMarketAnalysisAgent(SimpleAgent):
-    """Agent for real-time market data analysis."""
+    """Agent for real-time market data analysis.
+
+    Price history per symbol is a fixed-size NumPy ring buffer with running
+    sums for the 5- and 10-tick moving averages, so each tick is O(1) and
+    allocates nothing.
+    """
+
+    HISTORY_SIZE = 100
 
     def __init__(self, **kwargs):
         super().__init__(
@@ -107,7 +247,8 @@ class RealTimeMarketAnalysisAgent(SimpleAgent):
             **kwargs
         )
         self.price_history = {}
-        self.alerts = []
+        # Bounded so long-running streams don't grow without limit
+        self.alerts = deque(maxlen=64)
 
     async def execute(self, input_data: Any, context: ExecutionContext) -> Dict[str, Any]:
         """Analyze real-time market data."""
@@ -118,18 +259,17 @@ class RealTimeMarketAnalysisAgent(SimpleAgent):
         current_price = input_data["price"]
         timestamp = input_data["timestamp"]
 
-        # Track price history
-        if symbol not in self.price_history:
-            self.price_history[symbol] = []
-
-        self.price_history[symbol].append({
-            "price": current_price,
-            "timestamp": timestamp
-        })
-
-        # Keep only last 100 data points
-        if len(self.price_history[symbol]) > 100:
-            self.price_history[symbol] = self.price_history[symbol][-100:]
+        # Track price history (last HISTORY_SIZE data points)
+        window = self.price_history.get(symbol)
+        if window is None:
+            window = self.price_history[symbol] = {
+                "buf": np.empty(self.HISTORY_SIZE, dtype=np.float64),
+                "head": 0,
+                "count": 0,
+                "sum5": 0.0,
+                "sum10": 0.0,
+            }
+        self._push_price(window, current_price)
 
         # Generate analysis
         analysis = self._analyze_price_trend(symbol, current_price)
@@ -142,17 +282,37 @@ class RealTimeMarketAnalysisAgent(SimpleAgent):
             "agent_id": self.id
         }
 
+    @staticmethod
+    def _push_price(window: Dict[str, Any], price: float) -> None:
+        """Append `price` to a ring buffer, updating the rolling sums in O(1)."""
+        buf = window["buf"]
+        size = len(buf)
+        head = window["head"]
+        count = window["count"]
+
+        # Retire the values leaving the 5- and 10-tick windows
+        if count >= 5:
+            window["sum5"] -= buf.item((head - 5) % size)
+        if count >= 10:
+            window["sum10"] -= buf.item((head - 10) % size)
+
+        buf[head] = price
+        window["sum5"] += price
+        window["sum10"] += price
+        window["head"] = (head + 1) % size
+        window["count"] = min(count + 1, size)
+
     def _analyze_price_trend(self, symbol: str, current_price: float) -> Dict[str, Any]:
         """Analyze price trend and generate alerts."""
-        history = self.price_history[symbol]
+        window = self.price_history[symbol]
+        count = window["count"]
 
-        if len(history) < 5:
+        if count < 5:
             return {"trend": "insufficient_data", "confidence": 0}
 
-        # Calculate moving averages
-        prices = [h["price"] for h in history[-10:]]
-        short_ma = sum(prices[-5:]) / 5 if len(prices) >= 5 else current_price
-        long_ma = sum(prices) / len(prices)
+        # Moving averages come straight from the rolling sums
+        short_ma = window["sum5"] / 5
+        long_ma = window["sum10"] / min(count, 10)
 
         # Determine trend
         if short_ma > long_ma * 1.02:
@@ -163,8 +323,9 @@ class RealTimeMarketAnalysisAgent(SimpleAgent):
             trend = "sideways"
 
         # Check for significant price movements
-        if len(history) >= 2:
-            prev_price = history[-2]["price"]
+        if count >= 2:
+            buf = window["buf"]
+            prev_price = buf.item((window["head"] - 2) % len(buf))
             price_change = (current_price - prev_price) / prev_price * 100
 
             if abs(price_change) > 5:  # 5% movement
@@ -180,13 +341,21 @@ class RealTimeMarketAnalysisAgent(SimpleAgent):
             "trend": trend,
             "short_ma": round(short_ma, 2),
             "long_ma": round(long_ma, 2),
-            "confidence": min(len(history) / 20, 1.0),
-            "alerts": self.alerts[-5:]  # Last 5 alerts
+            "confidence": min(count / 20, 1.0),
+            "alerts": list(islice(self.alerts, max(len(self.alerts) - 5, 0), None))  # Last 5 alerts
         }
 
 
 class RealTimeAnomalyDetectionAgent(SimpleAgent):
-    """Agent for detecting anomalies in real-time data streams."""
+    """Agent for detecting anomalies in real-time data streams.
+
+    Sensor windows live in one float32 matrix (one row per sensor, used as a
+    ring buffer) with per-row head and count arrays; the Z-score is computed
+    over a contiguous row by `window_zscore` (Numba-compiled when available).
+    """
+
+    WINDOW_SIZE = 50
+    MAX_SENSORS = 10
 
     def __init__(self, threshold: float = 2.5, **kwargs):
         super().__init__(
@@ -195,8 +364,27 @@ class RealTimeAnomalyDetectionAgent(SimpleAgent):
             **kwargs
         )
         self.threshold = threshold
-        self.data_windows = {}
-        self.anomalies = []
+        self.sensor_slots: Dict[str, int] = {}
+        self.windows = np.zeros((self.MAX_SENSORS, self.WINDOW_SIZE), dtype=np.float32)
+        self.heads = np.zeros(self.MAX_SENSORS, dtype=np.int64)
+        self.counts = np.zeros(self.MAX_SENSORS, dtype=np.int64)
+        # Bounded history of recent anomalies; anomaly_count keeps the total
+        self.anomalies = deque(maxlen=256)
+        self.anomaly_count = 0
+
+    def _slot(self, sensor_id: str) -> int:
+        """Return the window row for a sensor, growing the matrix when full."""
+        slot = self.sensor_slots.get(sensor_id)
+        if slot is None:
+            slot = self.sensor_slots[sensor_id] = len(self.sensor_slots)
+            if slot == len(self.windows):
+                grow = len(self.windows)
+                self.windows = np.vstack(
+                    (self.windows, np.zeros((grow, self.WINDOW_SIZE), dtype=np.float32))
+                )
+                self.heads = np.concatenate((self.heads, np.zeros(grow, dtype=np.int64)))
+                self.counts = np.concatenate((self.counts, np.zeros(grow, dtype=np.int64)))
+        return slot
 
     async def execute(self, input_data: Any, context: ExecutionContext) -> Dict[str, Any]:
         """Detect anomalies in real-time sensor data."""
@@ -207,19 +395,16 @@ class RealTimeAnomalyDetectionAgent(SimpleAgent):
         if temperature is None:
             return {"error": "No temperature data provided"}
 
-        # Maintain sliding window for each sensor
-        if sensor_id not in self.data_windows:
-            self.data_windows[sensor_id] = []
+        # Maintain sliding window for each sensor (last WINDOW_SIZE readings)
+        slot = self._slot(sensor_id)
+        head = self.heads[slot]
+        self.windows[slot, head] = temperature
+        self.heads[slot] = (head + 1) % self.WINDOW_SIZE
+        count = min(int(self.counts[slot]) + 1, self.WINDOW_SIZE)
+        self.counts[slot] = count
 
-        self.data_windows[sensor_id].append(temperature)
-
-        # Keep only last 50 readings
-        if len(self.data_windows[sensor_id]) > 50:
-            self.data_windows[sensor_id] = self.data_windows[sensor_id][-50:]
-
-        # Detect anomaly using Z-score
-        window = self.data_windows[sensor_id]
-        is_anomaly, z_score = self._detect_anomaly(temperature, window)
+        # Detect anomaly using Z-score; ring order does not matter for mean/std
+        is_anomaly, z_score = self._detect_anomaly(temperature, self.windows[slot, :count])
 
         result = {
             "sensor_id": sensor_id,
@@ -227,7 +412,7 @@ class RealTimeAnomalyDetectionAgent(SimpleAgent):
             "is_anomaly": is_anomaly,
             "z_score": round(z_score, 3) if z_score else None,
             "timestamp": timestamp,
-            "window_size": len(window),
+            "window_size": count,
             "agent_id": self.id
         }
 
@@ -239,23 +424,22 @@ class RealTimeAnomalyDetectionAgent(SimpleAgent):
                 "timestamp": timestamp
             }
             self.anomalies.append(anomaly)
-            result["recent_anomalies"] = self.anomalies[-10:]
+            self.anomaly_count += 1
+            result["recent_anomalies"] = list(
+                islice(self.anomalies, max(len(self.anomalies) - 10, 0), None)
+            )
 
         return result
 
-    def _detect_anomaly(self, value: float, window: List[float]) -> tuple[bool, Optional[float]]:
-        """Detect anomaly using Z-score method."""
+    def _detect_anomaly(self, value: float, window: np.ndarray) -> tuple[bool, Optional[float]]:
+        """Detect anomaly using Z-score method over a sensor's window."""
         if len(window) < 10:  # Need sufficient data
             return False, None
 
-        mean = sum(window) / len(window)
-        variance = sum((x - mean) ** 2 for x in window) / len(window)
-        std_dev = variance ** 0.5
-
-        if std_dev == 0:
+        z_score = window_zscore(window, float(value))
+        if z_score == 0.0:
             return False, 0
 
-        z_score = abs(value - mean) / std_dev
         is_anomaly = z_score > self.threshold
 
         return is_anomaly, z_score
@@ -272,14 +456,19 @@ class RealTimeLogAnalysisAgent(SimpleAgent):
         )
         self.error_counts = {}
         self.response_times = {}
-        self.alerts = []
+        self.alerts = deque(maxlen=64)
 
     async def execute(self, input_data: Any, context: ExecutionContext) -> Dict[str, Any]:
         """Analyze real-time log data."""
-        log_level = input_data.get("level")
-        service = input_data.get("service")
-        response_time = input_data.get("response_time")
-        timestamp = input_data.get("timestamp")
+        if isinstance(input_data, (bytes, bytearray, str)):
+            input_data = _loads(input_data)
+        try:
+            log_level, service, response_time, timestamp = _log_fields(input_data)
+        except KeyError:
+            log_level = input_data.get("level")
+            service = input_data.get("service")
+            response_time = input_data.get("response_time")
+            timestamp = input_data.get("timestamp")
 
         # Track error rates
         if service not in self.error_counts:
@@ -365,19 +554,21 @@ async def demo_real_time_market_analysis():
     print("Starting real-time market analysis (10 seconds)...")
     start_time = time.time()
 
-    # Process stream for 10 seconds
-    async for stock_data in stock_stream:
+    # Process stream for 10 seconds, one agent call per batch of ticks
+    context = ExecutionContext(agent_id=market_agent.id)
+    async for batch in batched(buffered(stock_stream), 20, 0.1):
         if time.time() - start_time > 10:
             break
 
         # Analyze the data
-        context = ExecutionContext(agent_id=market_agent.id)
-        result = await market_agent.run(stock_data, context)
+        results = await market_agent.run_batch(batch, context)
 
         # Display results
-        if result["status"] == "completed":
+        for result in results:
+            if result["status"] != "completed":
+                continue
             output = result["output"]
-            print(f"📈 {output['symbol']}: ${output['current_price']} | "
+            print(f"📈 {output['symbol']}: ${output['current_price']:.2f} | "
                   f"Trend: {output['analysis']['trend']} | "
                   f"Confidence: {output['analysis']['confidence']:.2f}")
 
@@ -408,24 +599,26 @@ async def demo_real_time_anomaly_detection():
     print("Starting real-time anomaly detection (8 seconds)...")
     start_time = time.time()
 
-    # Process stream for 8 seconds
-    async for sensor_data in sensor_stream:
+    # Process stream for 8 seconds, one agent call per batch of readings
+    context = ExecutionContext(agent_id=anomaly_agent.id)
+    async for batch in batched(buffered(sensor_stream), 20, 0.1):
         if time.time() - start_time > 8:
             break
 
         # Detect anomalies
-        context = ExecutionContext(agent_id=anomaly_agent.id)
-        result = await anomaly_agent.run(sensor_data, context)
+        results = await anomaly_agent.run_batch(batch, context)
 
         # Display results
-        if result["status"] == "completed":
+        for result in results:
+            if result["status"] != "completed":
+                continue
             output = result["output"]
             status = "🔴 ANOMALY" if output["is_anomaly"] else "🟢 NORMAL"
-            print(f"{status} {output['sensor_id']}: {output['temperature']}°C "
+            print(f"{status} {output['sensor_id']}: {output['temperature']:.1f}°C "
                   f"(Z-score: {output['z_score']})")
 
     simulator.is_running = False
-    print(f"Anomaly detection completed. Found {len(anomaly_agent.anomalies)} anomalies.\n")
+    print(f"Anomaly detection completed. Found {anomaly_agent.anomaly_count} anomalies.\n")
 
 
 async def demo_real_time_log_analysis():
@@ -442,24 +635,33 @@ async def demo_real_time_log_analysis():
     # Start log stream
     log_stream = await simulator.start_log_stream()
 
+    # Publish analyses to Kafka (in-memory unless KAFKA_BACKEND says otherwise);
+    # messages are enqueued per log and only flushed once per batch
+    producer = await get_producer(
+        backend=os.environ.get("KAFKA_BACKEND", "inmemory"),
+        bootstrap_servers=os.environ.get("KAFKA_BOOTSTRAP_SERVERS"),
+    )
+
     print("Starting real-time log analysis (5 seconds)...")
     start_time = time.time()
 
-    # Process stream for 5 seconds
+    # Process stream for 5 seconds, one agent call per batch of log lines
     processed_logs = 0
-    async for log_data in log_stream:
+    context = ExecutionContext(agent_id=log_agent.id)
+    async for batch in batched(buffered(log_stream), 20, 0.1):
         if time.time() - start_time > 5:
             break
 
         # Analyze logs
-        context = ExecutionContext(agent_id=log_agent.id)
-        result = await log_agent.run(log_data, context)
-
-        processed_logs += 1
+        results = await log_agent.run_batch(batch, context)
 
-        # Display results every 20 logs
-        if processed_logs % 20 == 0:
+        for result in results:
+            processed_logs += 1
             if result["status"] == "completed":
+                await producer.enqueue("log-analysis", result["output"])
+
+            # Display results every 20 logs
+            if processed_logs % 20 == 0 and result["status"] == "completed":
                 output = result["output"]
                 analysis = output["analysis"]
                 status = "🔴" if analysis["health_status"] == "unhealthy" else "🟢"
@@ -467,7 +669,11 @@ async def demo_real_time_log_analysis():
                       f"Error Rate: {analysis['error_rate']}% | "
                       f"Avg Response: {analysis['avg_response_time']}ms")
 
+        await producer.flush()
+
     simulator.is_running = False
+    if hasattr(producer, "stop"):
+        await producer.stop()
     print(f"Log analysis completed. Processed {processed_logs} logs.\n")
 
 
@@ -560,37 +766,40 @@ def get_real_world_problem_sources():
 
 async def main():
     """Run all real-time problem demonstrations."""
-    print("🚀 AI Agent Framework - Real-Time Problem Solving Demonstration\n")
-
-    # Run real-time demos
-    await demo_real_time_market_analysis()
-    await demo_real_time_anomaly_detection()
-    await demo_real_time_log_analysis()
-
-    # Show real-world problem sources
-    print("=== Real-World Problem Sources ===")
-    problems = get_real_world_problem_sources()
-
-    for i, problem in enumerate(problems, 1):
-        print(f"\n{i}. {problem.name}")
-        print(f"   Description: {problem.description}")
-        print(f"   Data Sources: {problem.data_source}")
-        print(f"   Update Frequency: {problem.update_frequency}")
-        print(f"   Complexity: {problem.complexity}")
-        print(f"   Example Data: {problem.example_data}")
-
-    print(f"\n=== Framework Real-Time Capabilities ===")
-    print("✅ Streaming data processing with async agents")
-    print("✅ Real-time analytics and pattern detection")
-    print("✅ Event-driven workflow orchestration")
-    print("✅ Kafka integration for high-throughput messaging")
-    print("✅ Professional agent ID tracking for all operations")
-    print("✅ Memory and state management for continuous learning")
-    print("✅ Anomaly detection and alerting systems")
-    print("✅ Multi-agent collaboration for complex problems")
-
-    print(f"\n🎉 Real-time problem solving demonstration completed!")
-    print("The framework is ready to handle real-world, real-time problems!")
+    try:
+        print("🚀 AI Agent Framework - Real-Time Problem Solving Demonstration\n")
+
+        # Run real-time demos
+        await demo_real_time_market_analysis()
+        await demo_real_time_anomaly_detection()
+        await demo_real_time_log_analysis()
+
+        # Show real-world problem sources
+        print("=== Real-World Problem Sources ===")
+        problems = get_real_world_problem_sources()
+
+        for i, problem in enumerate(problems, 1):
+            print(f"\n{i}. {problem.name}")
+            print(f"   Description: {problem.description}")
+            print(f"   Data Sources: {problem.data_source}")
+            print(f"   Update Frequency: {problem.update_frequency}")
+            print(f"   Complexity: {problem.complexity}")
+            print(f"   Example Data: {problem.example_data}")
+
+        print(f"\n=== Framework Real-Time Capabilities ===")
+        print("✅ Streaming data processing with async agents")
+        print("✅ Real-time analytics and pattern detection")
+        print("✅ Event-driven workflow orchestration")
+        print("✅ Kafka integration for high-throughput messaging")
+        print("✅ Professional agent ID tracking for all operations")
+        print("✅ Memory and state management for continuous learning")
+        print("✅ Anomaly detection and alerting systems")
+        print("✅ Multi-agent collaboration for complex problems")
+
+        print(f"\n🎉 Real-time problem solving demonstration completed!")
+        print("The framework is ready to handle real-world, real-time problems!")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -11,4 +11,24 @@ class AgentAdmin(admin.ModelAdmin):
 @admin.register(AgentRun)
 class AgentRunAdmin(admin.ModelAdmin):
     list_display = ("id", "agent", "status", "created_at", "updated_at")
+    list_select_related = ("agent",)
     search_fields = ("agent__name", "id")
+
+    # Columns needed to render the changelist; the JSON payload columns are
+    # skipped there but still loaded for the change form.
+    changelist_fields = (
+        "id",
+        "status",
+        "created_at",
+        "updated_at",
+        "agent__id",
+        "agent__name",
+    )
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        opts = self.model._meta
+        if match and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist":
+            qs = qs.select_related("agent").only(*self.changelist_fields)
+        return qs
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('agents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agent',
+            name='name',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name='agentrun',
+            index=models.Index(fields=['status'], name='agents_agen_status_7a307a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='agentrun',
+            index=models.Index(fields=['agent', '-created_at'], name='agents_agen_agent_i_23bfec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='agentrun',
+            index=models.Index(fields=['-created_at'], name='agents_agen_created_3483d6_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:07
+
+import ai_framework.json_codecs
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('agents', '0002_agentrun_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agentrun',
+            name='input_payload',
+            field=models.JSONField(decoder=ai_framework.json_codecs.ORJSONDecoder, encoder=ai_framework.json_codecs.ORJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name='agentrun',
+            name='output',
+            field=models.JSONField(blank=True, decoder=ai_framework.json_codecs.ORJSONDecoder, encoder=ai_framework.json_codecs.ORJSONEncoder, null=True),
+        ),
+    ]
@@ -1,10 +1,12 @@
 from django.db import models
 import uuid
 
+from ai_framework.json_codecs import ORJSONDecoder, ORJSONEncoder
+
 
 class Agent(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, db_index=True)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -15,11 +17,20 @@ class Agent(models.Model):
 class AgentRun(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     agent = models.ForeignKey(Agent, on_delete=models.CASCADE)
-    input_payload = models.JSONField()
-    output = models.JSONField(null=True, blank=True)
+    input_payload = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder)
+    output = models.JSONField(
+        null=True, blank=True, encoder=ORJSONEncoder, decoder=ORJSONDecoder
+    )
     status = models.CharField(max_length=50, default="PENDING")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status"]),
+            models.Index(fields=["agent", "-created_at"]),
+            models.Index(fields=["-created_at"]),
+        ]
+
     def __str__(self):
         return f"{self.agent.name} - {self.id}"
@@ -12,3 +12,11 @@ class AgentRunSerializer(serializers.ModelSerializer):
     class Meta:
         model = AgentRun
         fields = "__all__"
+
+
+class AgentRunListSerializer(serializers.ModelSerializer):
+    """Summary view of a run for list endpoints; omits the JSON payloads."""
+
+    class Meta:
+        model = AgentRun
+        fields = ("id", "agent", "status", "created_at", "updated_at")
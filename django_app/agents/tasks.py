@@ -1,11 +1,17 @@
 from celery import shared_task
+from django.utils import timezone
 from .models import AgentRun
 from ..workflows.adapters import enqueue_agent_run
 
 
 @shared_task
 def submit_agent_run(agent_run_id):
-    run = AgentRun.objects.get(id=agent_run_id)
-    enqueue_agent_run(str(run.id), str(run.agent.id), run.input_payload)
-    run.status = "ENQUEUED"
-    run.save()
+    # Only the columns needed to publish; agent_id avoids loading the Agent
+    # and the (possibly large) output JSON is never fetched.
+    run = AgentRun.objects.only("id", "agent_id", "input_payload").get(id=agent_run_id)
+    enqueue_agent_run(str(run.id), str(run.agent_id), run.input_payload)
+    # Targeted UPDATE instead of writing the whole row back; update() skips
+    # auto_now, so updated_at is set explicitly.
+    AgentRun.objects.filter(pk=run.pk).update(
+        status="ENQUEUED", updated_at=timezone.now()
+    )
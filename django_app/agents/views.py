@@ -1,10 +1,18 @@
-from rest_framework import viewsets, status
+import functools
+
+from django.db import transaction
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from .models import Agent, AgentRun
-from .serializers import AgentSerializer, AgentRunSerializer
+from .serializers import AgentSerializer, AgentRunSerializer, AgentRunListSerializer
 from src.sdk.agents import list_agents, get_agent
 
+# Formats timestamps exactly as the model serializers do, for the hand-built
+# responses below
+_datetime_field = serializers.DateTimeField()
+
 
 class AgentViewSet(viewsets.ModelViewSet):
     queryset = Agent.objects.all()
@@ -14,13 +22,27 @@ class AgentViewSet(viewsets.ModelViewSet):
     def start(self, request, pk=None):
         agent = self.get_object()
         payload = request.data.get("input", {})
-        run = AgentRun.objects.create(
-            agent=agent, input_payload=payload, status="QUEUED"
-        )
         from ..workflows.adapters import enqueue_agent_run
 
-        enqueue_agent_run(str(run.id), agent.id, payload)
-        return Response(AgentRunSerializer(run).data, status=status.HTTP_201_CREATED)
+        with transaction.atomic():
+            run = AgentRun.objects.create(
+                agent=agent, input_payload=payload, status="QUEUED"
+            )
+            # Publish only after the row is committed, so a fast worker never
+            # receives an event for a run it cannot read yet
+            transaction.on_commit(
+                functools.partial(enqueue_agent_run, str(run.id), agent.id, payload)
+            )
+        # The caller only needs the run handle; skip the full serializer
+        return Response(
+            {
+                "id": str(run.id),
+                "agent": str(run.agent_id),
+                "status": run.status,
+                "created_at": _datetime_field.to_representation(run.created_at),
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
     @action(detail=False, methods=["get"])
     def available(self, request):
@@ -46,9 +68,37 @@ class AgentViewSet(viewsets.ModelViewSet):
         agent = Agent.objects.create(
             name=getattr(a, "name", name), description=getattr(a, "description", "")
         )
-        return Response(AgentSerializer(agent).data, status=status.HTTP_201_CREATED)
+        return Response(
+            {
+                "id": str(agent.id),
+                "name": agent.name,
+                "description": agent.description,
+                "created_at": _datetime_field.to_representation(agent.created_at),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class AgentRunCursorPagination(CursorPagination):
+    """Newest-first keyset pages; served by the (-created_at) index."""
+
+    ordering = "-created_at"
+    page_size = 50
 
 
 class AgentRunViewSet(viewsets.ModelViewSet):
     queryset = AgentRun.objects.all()
     serializer_class = AgentRunSerializer
+    pagination_class = AgentRunCursorPagination
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AgentRunListSerializer
+        return AgentRunSerializer
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            # Skip fetching the JSON payload columns the list view never renders
+            qs = qs.only(*AgentRunListSerializer.Meta.fields)
+        return qs
@@ -0,0 +1,135 @@
+"""Read-only serializers compiled once into a single Python function.
+
+DRF's `Serializer.to_representation` walks every field per instance,
+resolving sources, checking for `SkipField`, and building a `ReturnDict`.
+`compile_serializer` does that resolution once: it generates the source of
+a `dump(obj) -> dict` function in which plain model columns become direct
+attribute reads (foreign keys read their `<name>_id` column), method
+fields call their `get_<name>` method directly, and only the remaining
+fields (datetimes, nested serializers) call back into the bound DRF
+field. The output matches `SerializerClass(obj).data` for the readable
+fields.
+"""
+
+import inspect
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields as drf_fields
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
+
+# Field types whose to_representation reduces to a single expression on a
+# model attribute that is not None
+_INLINE = (
+    (drf_fields.CharField, "str(v)"),
+    (drf_fields.IntegerField, "int(v)"),
+    (drf_fields.ReadOnlyField, "v"),
+)
+
+
+def _generic(field):
+    """Fallback: exactly what Serializer.to_representation does per field."""
+    get_attribute = field.get_attribute
+    to_representation = field.to_representation
+
+    def represent(obj):
+        attribute = get_attribute(obj)
+        check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        if check_for_none is None:
+            return None
+        return to_representation(attribute)
+
+    return represent
+
+
+def _inline_expression(model, field):
+    """Expression for `v` (the attribute value) equivalent to the field, or None."""
+    attrs = field.source_attrs
+    if len(attrs) != 1 or not attrs[0].isidentifier():
+        return None
+    # DRF calls callable sources (model methods); a plain attribute read would not
+    if callable(inspect.getattr_static(model, attrs[0], None)):
+        return None
+    if isinstance(field, drf_fields.UUIDField):
+        return "str(v)" if field.uuid_format == "hex_verbose" else None
+    if isinstance(field, drf_fields.JSONField):
+        return None if field.binary else "v"
+    for field_class, expr in _INLINE:
+        if isinstance(field, field_class):
+            return expr
+    return None
+
+
+def _foreign_key_attname(model, field):
+    """Column holding the related pk when `field` just outputs it, or None.
+
+    DRF reads the same column (via `serializable_value`) and returns it
+    unchanged, without loading the related object.
+    """
+    if (
+        type(field).to_representation is not PrimaryKeyRelatedField.to_representation
+        or field.pk_field is not None
+        or len(field.source_attrs) != 1
+    ):
+        return None
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])
+    except FieldDoesNotExist:
+        return None
+    if model_field.concrete and (model_field.many_to_one or model_field.one_to_one):
+        return model_field.attname
+    return None
+
+
+def compile_serializer(serializer_class, **kwargs):
+    """Return a `dump(obj)` function equivalent to `serializer_class(obj).data`.
+
+    `serializer_class` must be a `ModelSerializer` and `obj` an instance of
+    its model.
+
+    `kwargs` are passed to the serializer instance the fields are bound to
+    (e.g. `context`); it is created once and kept alive by the closure so
+    `SerializerMethodField`s can still reach their `get_<name>` methods.
+    """
+    serializer = serializer_class(**kwargs)
+    model = serializer.Meta.model
+    namespace = {"_serializer": serializer}
+    items = []
+    for index, field in enumerate(serializer._readable_fields):
+        key = repr(field.field_name)
+        expr = _inline_expression(model, field)
+        if expr is not None:
+            items.append(f"{key}: None if (v := obj.{field.source_attrs[0]}) is None else {expr}")
+        elif (attname := _foreign_key_attname(model, field)) is not None:
+            items.append(f"{key}: obj.{attname}")
+        elif isinstance(field, drf_fields.SerializerMethodField):
+            # Its source is the object itself, so this is all the field does
+            namespace[f"_f{index}"] = getattr(serializer, field.method_name)
+            items.append(f"{key}: _f{index}(obj)")
+        else:
+            namespace[f"_f{index}"] = _generic(field)
+            items.append(f"{key}: _f{index}(obj)")
+
+    source = "def dump(obj):\n    return {\n" + "".join(
+        f"        {item},\n" for item in items
+    ) + "    }\n"
+    exec(compile(source, f"<compiled {serializer_class.__name__}>", "exec"), namespace)
+    dump = namespace["dump"]
+    dump.__doc__ = f"Compiled read-only representation of {serializer_class.__name__}."
+    return dump
+
+
+class CompiledRepresentationMixin:
+    """Serve `to_representation` from `compile_serializer(type(self))`.
+
+    The function is compiled on first use and cached on the class, so every
+    instance (including nested and `many=True` children) shares it. Only
+    for serializers whose output does not depend on `context` or per-instance
+    field changes.
+    """
+
+    def to_representation(self, instance):
+        cls = type(self)
+        dump = cls.__dict__.get("_compiled_dump")
+        if dump is None:
+            dump = cls._compiled_dump = compile_serializer(cls)
+        return dump(instance)
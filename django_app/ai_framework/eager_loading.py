@@ -0,0 +1,21 @@
+"""Serializer-declared eager loading for DRF views."""
+
+
+class EagerLoadingMixin:
+    """Serializer mixin declaring the relations its fields read.
+
+    Views pass their base queryset through `setup_eager_loading`, so the
+    joins and prefetches live next to the fields that need them instead of
+    being repeated in every view.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
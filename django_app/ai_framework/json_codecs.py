@@ -0,0 +1,49 @@
+"""orjson-backed JSON codecs for model JSONFields and DRF responses.
+
+Every class falls back to the stdlib/DRF behaviour when orjson is not
+installed, so the project keeps working without it.
+"""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """JSONField encoder that serializes with orjson when available."""
+
+    def encode(self, o):
+        if orjson is None:
+            return super().encode(o)
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    """JSONField decoder that parses with orjson when available."""
+
+    def decode(self, s, *args, **kwargs):
+        if orjson is None:
+            return super().decode(s, *args, **kwargs)
+        return orjson.loads(s)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """DRF JSON renderer that encodes compact responses with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # orjson only supports a fixed two-space indent; keep DRF's output
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data,
+            default=DRFJSONEncoder().default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
@@ -0,0 +1,74 @@
+# Authentication backends: email login and cached token authentication
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from .models import CustomUser
+
+TOKEN_CACHE_TTL = getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60)
+
+
+class EmailBackend(ModelBackend):
+    """Authenticate with email and password in a single user lookup.
+
+    Login used to resolve the username from the email and then let
+    ModelBackend fetch the same row again by username.
+    """
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        try:
+            user = CustomUser._default_manager.get(email=email)
+        except CustomUser.DoesNotExist:
+            # Run the hasher anyway, as ModelBackend does, so response time
+            # does not reveal whether the email is registered
+            CustomUser().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+
+def token_cache_key(key):
+    return f'tok:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that caches the (user, token) pair per key.
+
+    Saves the Token/User lookup on every authenticated request. Entries are
+    dropped when the token is deleted (logout, password change) or the user
+    is saved, and otherwise expire after TOKEN_CACHE_TTL seconds.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # Raises AuthenticationFailed for unknown keys and inactive users,
+        # so only valid credentials are ever cached
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token), TOKEN_CACHE_TTL)
+        return user, token
+
+
+# These receivers are connected when DRF first imports this class, which is
+# before anything can have been cached.
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Forget a token as soon as it is deleted"""
+    cache.delete(token_cache_key(instance.key))
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_tokens(sender, instance, created, **kwargs):
+    """Drop cached copies of a user whenever the user row changes"""
+    if created:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
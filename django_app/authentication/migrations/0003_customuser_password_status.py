@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_customuser_cu_email_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='password_pending_since',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='password_status',
+            field=models.CharField(choices=[('set', 'Set'), ('pending', 'Pending'), ('failed', 'Failed')], default='set', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='password_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -14,6 +14,26 @@ class CustomUser(AbstractUser):
     updated_at = models.DateTimeField(auto_now=True)
     is_email_verified = models.BooleanField(default=False)
 
+    # Passwords are hashed in the background (see password_hashing); these
+    # track the latest requested password until its hash is stored
+    PASSWORD_SET = 'set'
+    PASSWORD_PENDING = 'pending'
+    PASSWORD_FAILED = 'failed'
+    PASSWORD_STATUS_CHOICES = [
+        (PASSWORD_SET, 'Set'),
+        (PASSWORD_PENDING, 'Pending'),
+        (PASSWORD_FAILED, 'Failed'),
+    ]
+    password_status = models.CharField(
+        max_length=10, choices=PASSWORD_STATUS_CHOICES, default=PASSWORD_SET
+    )
+    password_pending_since = models.DateTimeField(null=True, blank=True)
+    password_version = models.PositiveIntegerField(default=0)
+
+    class Meta(AbstractUser.Meta):
+        # Login and registration look users up by email
+        indexes = [models.Index(fields=['email'], name='cu_email_idx')]
+
     def __str__(self):
         return self.email
 
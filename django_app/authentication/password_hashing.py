@@ -0,0 +1,134 @@
+# Background password hashing
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from .backends import token_cache_key
+from .models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+# Password hashers are deliberately slow; keeping them off the request thread
+# means their cost can be raised without raising request latency. A thread
+# pool is used rather than Celery so raw passwords never pass through the
+# message broker. hashlib's PBKDF2 releases the GIL while it works.
+_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='password-hash'
+)
+
+# Attempts per job before the change is marked failed
+PASSWORD_HASH_ATTEMPTS = 3
+
+# A change still pending after this many seconds was lost with its worker
+# (restart, OOM) and is reported as failed, so a new one can be requested
+PASSWORD_HASH_TIMEOUT = getattr(settings, 'PASSWORD_HASH_TIMEOUT', 300)
+
+
+def _mark_failed(user_id, version):
+    try:
+        CustomUser.objects.filter(pk=user_id, password_version=version).update(
+            password_status=CustomUser.PASSWORD_FAILED, password_pending_since=None
+        )
+    except Exception:
+        # Left pending; it is reported as failed once PASSWORD_HASH_TIMEOUT passes
+        logger.exception("Could not mark password change failed for user %s", user_id)
+
+
+def _store_hash(user_id, raw_password, version):
+    """Hash `raw_password` and store it if it is still the latest requested one.
+
+    The update only matches while the user's password_version equals
+    `version`, so a job that finishes after a newer change was requested
+    never overwrites it. Errors are retried; the last one marks the change
+    failed and is re-raised. Returns whether the hash was stored.
+    """
+    for attempt in range(1, PASSWORD_HASH_ATTEMPTS + 1):
+        try:
+            stored = CustomUser.objects.filter(pk=user_id, password_version=version).update(
+                password=make_password(raw_password),
+                password_status=CustomUser.PASSWORD_SET,
+                password_pending_since=None,
+                updated_at=timezone.now(),
+            )
+            break
+        except Exception:
+            if attempt == PASSWORD_HASH_ATTEMPTS:
+                logger.exception("Failed to store password hash for user %s", user_id)
+                _mark_failed(user_id, version)
+                raise
+            logger.warning(
+                "Storing password hash for user %s failed (attempt %d), retrying",
+                user_id, attempt, exc_info=True,
+            )
+            close_old_connections()
+
+    if stored:
+        # update() sends no post_save, so drop cached copies of the user here
+        keys = Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+        cache.delete_many([token_cache_key(key) for key in keys])
+    return bool(stored)
+
+
+def _hash_and_store(user_id, raw_password, version):
+    close_old_connections()
+    try:
+        return _store_hash(user_id, raw_password, version)
+    finally:
+        connection.close()
+
+
+def _submit(user_id, raw_password, version):
+    if getattr(settings, 'PASSWORD_HASHING_EAGER', False):
+        _store_hash(user_id, raw_password, version)
+        return
+    try:
+        _executor.submit(_hash_and_store, user_id, raw_password, version)
+    except RuntimeError:
+        # The pool is shut down (interpreter exiting): hash inline rather
+        # than drop the change
+        _store_hash(user_id, raw_password, version)
+
+
+def password_status(user):
+    """'set', 'pending' or 'failed' for the user's latest requested password."""
+    if (
+        user.password_status == CustomUser.PASSWORD_PENDING
+        and user.password_pending_since is not None
+        and user.password_pending_since < timezone.now() - timedelta(seconds=PASSWORD_HASH_TIMEOUT)
+    ):
+        return CustomUser.PASSWORD_FAILED
+    return user.password_status
+
+
+def queue_password_change(user, raw_password):
+    """Mark `user`'s password pending and hash `raw_password` once the transaction commits.
+
+    Returns False, changing nothing, while another change for the user is
+    still pending, so changes are applied one at a time and in order. The
+    stored password stays valid until the new hash replaces it; `user` is
+    refreshed with the new pending state.
+    """
+    now = timezone.now()
+    claimable = ~Q(password_status=CustomUser.PASSWORD_PENDING) | Q(
+        password_pending_since__lt=now - timedelta(seconds=PASSWORD_HASH_TIMEOUT)
+    )
+    claimed = CustomUser.objects.filter(claimable, pk=user.pk).update(
+        password_status=CustomUser.PASSWORD_PENDING,
+        password_pending_since=now,
+        password_version=F('password_version') + 1,
+    )
+    if not claimed:
+        return False
+
+    user.refresh_from_db(fields=['password_status', 'password_pending_since', 'password_version'])
+    user_id, version = user.pk, user.password_version
+    transaction.on_commit(lambda: _submit(user_id, raw_password, version))
+    return True
@@ -1,7 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from ai_framework.compiled_serializers import CompiledRepresentationMixin
+from ai_framework.eager_loading import EagerLoadingMixin
 from .models import CustomUser, UserProfile
+from .password_hashing import queue_password_change
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -36,15 +39,21 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data.pop('confirm_password')
+        password = validated_data.pop('password')
 
         # Use email as username if not provided
         if not validated_data.get('username'):
             validated_data['username'] = validated_data['email']
 
-        user = CustomUser.objects.create_user(**validated_data)
+        # Created with an unusable password and marked pending; the real
+        # hash is stored in the background after the transaction commits
+        user = CustomUser.objects.create_user(password=None, **validated_data)
+        queue_password_change(user, password)
 
-        # Create user profile
-        UserProfile.objects.get_or_create(user=user)
+        # Create user profile. The user is brand new, so there is nothing to
+        # look up unless a post_save receiver already created (and cached) it
+        if not CustomUser.profile.is_cached(user):
+            UserProfile.objects.create(user=user)
 
         return user
 
@@ -59,15 +68,9 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
 
         if email and password:
-            # Try to get user by email
-            try:
-                user_obj = CustomUser.objects.get(email=email)
-                username = user_obj.username
-            except CustomUser.DoesNotExist:
-                raise serializers.ValidationError('Invalid credentials')
-
+            # Resolved by authentication.backends.EmailBackend
             user = authenticate(request=self.context.get('request'),
-                              username=username, password=password)
+                              email=email, password=password)
 
             if not user:
                 raise serializers.ValidationError('Invalid credentials')
@@ -81,11 +84,13 @@ class UserLoginSerializer(serializers.Serializer):
             raise serializers.ValidationError('Must include email and password')
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CompiledRepresentationMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for user data"""
     full_name = serializers.ReadOnlyField()
     profile = serializers.SerializerMethodField()
 
+    select_related_fields = ('profile',)
+
     class Meta:
         model = CustomUser
         fields = ('id', 'email', 'username', 'first_name', 'last_name',
@@ -93,24 +98,29 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'is_email_verified')
 
     def get_profile(self, obj):
-        try:
-            profile = obj.profile
-            return {
-                'bio': profile.bio,
-                'company': profile.company,
-                'job_title': profile.job_title,
-                'phone': profile.phone,
-                'timezone': profile.timezone,
-                'preferences': profile.preferences
-            }
-        except UserProfile.DoesNotExist:
+        # Loaded by setup_eager_loading(). Every user gets a profile at
+        # registration; the default only covers accounts created elsewhere
+        # (createsuperuser, admin)
+        profile = getattr(obj, 'profile', None)
+        if profile is None:
             return {}
+        return {
+            'bio': profile.bio,
+            'company': profile.company,
+            'job_title': profile.job_title,
+            'phone': profile.phone,
+            'timezone': profile.timezone,
+            'preferences': profile.preferences
+        }
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for user profile"""
     user = UserSerializer(read_only=True)
 
+    # The nested UserSerializer reads user.profile, which the forward join caches
+    select_related_fields = ('user',)
+
     class Meta:
         model = UserProfile
         fields = '__all__'
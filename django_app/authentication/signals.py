@@ -9,12 +9,3 @@ def create_user_profile(sender, instance, created, **kwargs):
     """Create user profile when user is created"""
     if created:
         UserProfile.objects.get_or_create(user=instance)
-
-
-@receiver(post_save, sender=CustomUser)
-def save_user_profile(sender, instance, **kwargs):
-    """Save user profile when user is saved"""
-    try:
-        instance.profile.save()
-    except UserProfile.DoesNotExist:
-        UserProfile.objects.create(user=instance)
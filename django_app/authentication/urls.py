@@ -12,4 +12,5 @@ urlpatterns = [
     path('profile/', views.UserProfileView.as_view(), name='user-profile'),
     path('profile/details/', views.UserProfileDetailView.as_view(), name='user-profile-details'),
     path('change-password/', views.change_password_view, name='change-password'),
+    path('password-status/', views.password_status_view, name='password-status'),
 ]
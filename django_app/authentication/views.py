@@ -1,3 +1,8 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from rest_framework import status, generics, permissions
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
@@ -6,9 +11,12 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import login, logout
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db import transaction
 from django.dispatch import receiver
 from django.utils import timezone
+from ai_framework.compiled_serializers import compile_serializer
 from .models import CustomUser, UserProfile
+from .password_hashing import password_status, queue_password_change
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
@@ -17,6 +25,15 @@ from .serializers import (
 )
 
 
+# Bound once at import and shared by every view that returns a user
+_dump_user = compile_serializer(UserSerializer)
+
+
+def _optimized_user_qs():
+    """Users with the relations UserSerializer reads already loaded."""
+    return UserSerializer.setup_eager_loading(CustomUser.objects.all())
+
+
 class UserRegistrationView(generics.CreateAPIView):
     """User registration endpoint"""
     queryset = CustomUser.objects.all()
@@ -26,18 +43,22 @@ class UserRegistrationView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
 
-        # Create token for the user
-        token, created = Token.objects.get_or_create(user=user)
+        # User, profile and token are written in one transaction; a new user
+        # cannot have a token yet, so create it without a lookup
+        with transaction.atomic():
+            user = serializer.save()
+            token = Token.objects.create(user=user)
 
-        # Return user data with token
-        user_serializer = UserSerializer(user)
+        # The password is hashed in the background, so the account can log
+        # in once GET password-status/ reports 'set'. user.profile is cached
+        # from creation, so this does not query.
         return Response({
-            'user': user_serializer.data,
+            'user': _dump_user(user),
             'token': token.key,
-            'message': 'User registered successfully'
-        }, status=status.HTTP_201_CREATED)
+            'password_status': user.password_status,
+            'message': 'User registered; password is being set'
+        }, status=status.HTTP_202_ACCEPTED)
 
 
 class UserLoginView(ObtainAuthToken):
@@ -51,9 +72,8 @@ class UserLoginView(ObtainAuthToken):
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
 
-        # Update last login
-        user.last_login = timezone.now()
-        user.save()
+        # last_login is recorded by login() below (django.contrib.auth's
+        # update_last_login receiver), so no separate save is needed here
 
         # Get or create token
         token, created = Token.objects.get_or_create(user=user)
@@ -62,9 +82,8 @@ class UserLoginView(ObtainAuthToken):
         login(request, user)
 
         # Return user data with token
-        user_serializer = UserSerializer(user)
         return Response({
-            'user': user_serializer.data,
+            'user': _dump_user(user),
             'token': token.key,
             'message': 'Login successful'
         }, status=status.HTTP_200_OK)
@@ -93,8 +112,11 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return _optimized_user_qs()
+
     def get_object(self):
-        return self.request.user
+        return self.get_queryset().get(pk=self.request.user.pk)
 
 
 class UserProfileDetailView(generics.RetrieveUpdateAPIView):
@@ -102,8 +124,11 @@ class UserProfileDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return UserProfileSerializer.setup_eager_loading(UserProfile.objects.all())
+
     def get_object(self):
-        profile, created = UserProfile.objects.get_or_create(user=self.request.user)
+        profile, created = self.get_queryset().get_or_create(user=self.request.user)
         return profile
 
 
@@ -111,52 +136,92 @@ class UserProfileDetailView(generics.RetrieveUpdateAPIView):
 @permission_classes([IsAuthenticated])
 def user_me_view(request):
     """Get current user information"""
-    serializer = UserSerializer(request.user)
-    return Response(serializer.data)
+    return Response(_dump_user(request.user))
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def change_password_view(request):
-    """Change user password"""
+    """Change user password.
+
+    The new password is hashed in the background: the response is 202 with
+    a new token, and the old password keeps working until GET
+    password-status/ reports 'set'. An account whose registration password
+    failed to hash can set one without old_password; any other account,
+    including one whose password was disabled, must give it.
+    """
     user = request.user
     old_password = request.data.get('old_password')
     new_password = request.data.get('new_password')
 
-    if not old_password or not new_password:
+    # request.user may come from the token cache; check the stored password
+    user.refresh_from_db(fields=[
+        'password', 'password_status', 'password_pending_since', 'password_version'
+    ])
+    needs_old_password = user.has_usable_password() or (
+        password_status(user) != CustomUser.PASSWORD_FAILED
+    )
+
+    if not new_password or (needs_old_password and not old_password):
         return Response({
             'error': 'Both old_password and new_password are required'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    if not user.check_password(old_password):
+    if needs_old_password and not user.check_password(old_password):
         return Response({
             'error': 'Old password is incorrect'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    user.set_password(new_password)
-    user.save()
+    if not queue_password_change(user, new_password):
+        return Response({
+            'error': 'A password change is already pending',
+            'password_status': CustomUser.PASSWORD_PENDING
+        }, status=status.HTTP_409_CONFLICT)
 
-    # Update token
-    try:
-        user.auth_token.delete()
-        Token.objects.create(user=user)
-    except:
-        pass
+    # Rotate the token; the caller proved the current password, so it gets
+    # the new one to poll with
+    Token.objects.filter(user=user).delete()
+    token = Token.objects.create(user=user)
 
     return Response({
-        'message': 'Password changed successfully'
-    }, status=status.HTTP_200_OK)
+        'token': token.key,
+        'password_status': user.password_status,
+        'message': 'Password change accepted'
+    }, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def password_status_view(request):
+    """Whether the latest requested password has been stored"""
+    user = request.user
+    user.refresh_from_db(fields=['password_status', 'password_pending_since'])
+    return Response({'password_status': password_status(user)})
+
+
+# Activity records are handed to a queue; a listener thread writes them with
+# the root logger's handlers (settings.LOGGING), so logins never block on
+# the stream's lock or its write
+activity_logger = logging.getLogger('auth.activity')
+_root_handlers = logging.getLogger().handlers
+if _root_handlers:
+    _activity_queue = queue.SimpleQueue()
+    _activity_listener = QueueListener(_activity_queue, *_root_handlers, respect_handler_level=True)
+    _activity_listener.start()
+    atexit.register(_activity_listener.stop)
+    activity_logger.addHandler(QueueHandler(_activity_queue))
+    activity_logger.propagate = False
 
 
 # Signal handlers for logging user activity
 @receiver(user_logged_in)
 def user_logged_in_handler(sender, request, user, **kwargs):
     """Log user login activity"""
-    print(f"User {user.email} logged in at {timezone.now()}")
+    activity_logger.info("User %s logged in at %s", user.email, timezone.now())
 
 
 @receiver(user_logged_out)
 def user_logged_out_handler(sender, request, user, **kwargs):
     """Log user logout activity"""
     if user:
-        print(f"User {user.email} logged out at {timezone.now()}")
+        activity_logger.info("User %s logged out at %s", user.email, timezone.now())
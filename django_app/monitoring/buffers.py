@@ -0,0 +1,93 @@
+# Buffered writers for the high-volume monitoring tables
+import atexit
+import logging
+import os
+import threading
+
+from django.db import close_old_connections, connection
+from .models import AuditLog, MetricSample
+
+logger = logging.getLogger(__name__)
+
+
+class BulkBuffer:
+    """Collect rows in memory and insert them with bulk_create.
+
+    Rows are written by a background thread every `flush_interval` seconds,
+    or sooner once `max_rows` are pending, so callers never wait on the
+    database. Rows still pending at exit are flushed by an atexit hook;
+    rows pending when the process is killed are lost, which is acceptable
+    for metrics and audit events but not for anything transactional.
+    """
+
+    model = None
+
+    def __init__(self, flush_interval=0.5, max_rows=1000):
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self._rows = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread_pid = None
+        atexit.register(self.flush)
+
+    def _add(self, row):
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_rows
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+
+    def _ensure_thread(self):
+        # Threads do not survive a fork, so start one per process
+        if self._thread_pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread_pid != os.getpid():
+                threading.Thread(
+                    target=self._run, name=f"{self.model.__name__}-writer", daemon=True
+                ).start()
+                self._thread_pid = os.getpid()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                connection.close()
+
+    def flush(self):
+        """Insert every pending row now; returns the number written."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+        try:
+            self.model.objects.bulk_create(rows, batch_size=self.max_rows)
+        except Exception:
+            logger.exception("Dropped %d %s rows", len(rows), self.model.__name__)
+            return 0
+        return len(rows)
+
+
+class MetricBuffer(BulkBuffer):
+    model = MetricSample
+
+    def record(self, name, value, tags=None):
+        self._add(MetricSample(name=name, value=value, tags=tags))
+
+
+class AuditLogBuffer(BulkBuffer):
+    model = AuditLog
+
+    def record(self, run_id, event):
+        self._add(AuditLog(run_id=str(run_id), event=event))
+
+
+# Shared per-process buffers; use these instead of Model.objects.create()
+metrics = MetricBuffer()
+audit_log = AuditLogBuffer()
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['run_id', 'created_at'], name='auditlog_run_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='metricsample',
+            index=models.Index(fields=['name', 'created_at'], name='metric_name_created_idx'),
+        ),
+    ]
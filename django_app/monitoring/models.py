@@ -8,6 +8,10 @@ class AuditLog(models.Model):
     event = models.JSONField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Events are read per run, in order
+        indexes = [models.Index(fields=['run_id', 'created_at'], name='auditlog_run_created_idx')]
+
 
 class MetricSample(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -15,3 +19,7 @@ class MetricSample(models.Model):
     value = models.FloatField()
     tags = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # Samples are read per metric over a time range
+        indexes = [models.Index(fields=['name', 'created_at'], name='metric_name_created_idx')]
@@ -1,10 +1,14 @@
 
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from django.core.cache import cache
 from django.db import connection
 from agents.models import Agent
 from workflows.models import Workflow
 
+# Dashboards poll these endpoints; a few seconds of staleness is invisible
+COUNTS_CACHE_TTL = 5
+
 @api_view(["GET"])
 def health(request):
     return Response({"status": "ok"})
@@ -12,9 +16,10 @@ def health(request):
 @api_view(["GET"])
 def monitoring_root(request):
     """Return basic monitoring info (counts, status, etc)."""
+    counts = object_counts()
     return Response({
-        "agents_count": Agent.objects.count(),
-        "workflows_count": Workflow.objects.count(),
+        "agents_count": counts["agents"],
+        "workflows_count": counts["workflows"],
         "db_status": db_status(),
     })
 
@@ -22,13 +27,24 @@ def monitoring_root(request):
 def monitoring_stats(request):
     """Return system stats (can be expanded)."""
     # Example: return DB connection info and row counts
-    stats = {
-        "agents": Agent.objects.count(),
-        "workflows": Workflow.objects.count(),
-        "db_vendor": connection.vendor,
-    }
+    stats = dict(object_counts(), db_vendor=connection.vendor)
     return Response(stats)
 
+def _count_rows():
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        # Both counts in one round-trip
+        cursor.execute(
+            "SELECT (SELECT COUNT(*) FROM %s), (SELECT COUNT(*) FROM %s)"
+            % (qn(Agent._meta.db_table), qn(Workflow._meta.db_table))
+        )
+        agents, workflows = cursor.fetchone()
+    return {"agents": agents, "workflows": workflows}
+
+def object_counts():
+    """Row counts for agents and workflows, cached for COUNTS_CACHE_TTL seconds."""
+    return cache.get_or_set("mon:counts", _count_rows, COUNTS_CACHE_TTL)
+
 def db_status():
     try:
         connection.ensure_connection()
@@ -1,75 +1,180 @@
+import asyncio
+import atexit
 import logging
+import os
+import threading
 from django.conf import settings
 
 from src.messaging.kafka_client import get_producer
 
 logger = logging.getLogger(__name__)
 
+# Events are published from one long-lived event loop on a daemon thread, so
+# request handlers hand off the coroutine and return instead of spinning up a
+# loop and waiting for the broker on every call. The loop is created lazily
+# and re-created after a fork (e.g. gunicorn --preload), since threads do not
+# survive into the child process.
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+# Producer shared by every publish, and the lock that makes concurrent
+# publishes create only one; both are only touched from the background loop
+_producer = None
+_producer_lock = None
+
+
+def _background_loop():
+    global _loop, _loop_pid, _producer, _producer_lock
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="event-publisher", daemon=True
+            ).start()
+            # A producer and lock inherited over a fork belong to the
+            # parent's loop
+            _producer = _producer_lock = None
+            _loop, _loop_pid = loop, os.getpid()
+        return _loop
+
+
+def submit(coro):
+    """Schedule `coro` on the publisher loop; returns a concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop())
+
 
 def _producer_backend():
     # Use settings to decide backend; default to in-memory for tests
     return getattr(settings, "KAFKA_BACKEND", "inmemory")
 
 
+async def _get_producer():
+    global _producer, _producer_lock
+    if _producer_lock is None:
+        _producer_lock = asyncio.Lock()
+    async with _producer_lock:
+        if _producer is None:
+            _producer = await get_producer(
+                backend=_producer_backend(),
+                bootstrap_servers=getattr(settings, "KAFKA_BOOTSTRAP_SERVERS", None),
+                **getattr(settings, "KAFKA_PRODUCER_OPTIONS", {}),
+            )
+        return _producer
+
+
 async def _send_event(topic: str, event: dict) -> None:
+    global _producer
+    producer = None
     try:
-        prod = await get_producer(backend=_producer_backend(), bootstrap_servers=getattr(settings, "KAFKA_BOOTSTRAP_SERVERS", None))
-        await prod.send(topic, event)
+        producer = await _get_producer()
+        # No flush here: concurrent publishes share the producer's batches
+        # (linger_ms), and pending ones are flushed on shutdown
+        await producer.send(topic, event)
     except Exception as err:
-        # Log and fallback to direct call
+        # Stop and drop the producer so the next event reconnects, then let
+        # the caller fall back to a direct call. Concurrent sends that failed
+        # on the same producer stop it only once.
+        if producer is not None and producer is _producer:
+            _producer = None
+            if hasattr(producer, "stop"):
+                try:
+                    await producer.stop()
+                except Exception as stop_err:
+                    logger.debug("Failed to stop kafka producer: %s", stop_err)
         logger.debug("Failed to send event to kafka (%s): %s", topic, err)
         raise
 
 
+async def _publish(topic: str, event: dict, fallback) -> None:
+    try:
+        await _send_event(topic, event)
+    except Exception:
+        # The fallback may block (Celery publish or an inline run), so keep
+        # it off the publisher loop
+        await asyncio.get_running_loop().run_in_executor(None, fallback)
+
+
+async def _drain(timeout: float) -> None:
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    if pending:
+        await asyncio.wait(pending, timeout=timeout)
+    if _producer is not None and hasattr(_producer, "flush"):
+        await _producer.flush()
+
+
+@atexit.register
+def _flush_on_exit(timeout: float = 5.0) -> None:
+    """Deliver events still batched or in flight before the process exits."""
+    if _loop is None or _loop_pid != os.getpid():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_drain(timeout), _loop).result(timeout + 1)
+    except Exception as err:
+        logger.warning("Pending events were not flushed on exit: %s", err)
+
+
+def _workflow_fallback(run_id: str, workflow_id: str, payload: dict):
+    # Fallback: call in-process orchestrator
+    try:
+        from src.orchestrator.celery_tasks import execute_workflow_run
+
+        try:
+            execute_workflow_run.delay(run_id, {"id": str(workflow_id)}, payload)
+        except Exception:
+            execute_workflow_run(run_id, {"id": str(workflow_id)}, payload)
+    except Exception as err:
+        logger.debug("Fallback orchestrator call failed: %s", err)
+
+
+def _agent_fallback(run_id: str, agent_id: str, payload: dict):
+    try:
+        from src.orchestrator.celery_tasks import execute_agent_run
+
+        try:
+            execute_agent_run.delay(run_id, str(agent_id), payload)
+        except Exception:
+            execute_agent_run(run_id, str(agent_id), payload)
+    except Exception as err:
+        logger.debug("Fallback orchestrator agent call failed: %s", err)
+
+
 def enqueue_workflow_run(run_id: str, workflow_id: str, payload: dict):
+    """Publish a workflow run request without waiting for the broker.
+
+    Returns the future of the publish (including any fallback) for callers
+    that need to wait on it.
+    """
     event = {
         "type": "workflow.run.requested",
         "run_id": run_id,
         "workflow_id": workflow_id,
         "payload": payload,
     }
-
-    try:
-        # Try to publish asynchronously to the configured backend
-        import asyncio
-
-        asyncio.get_event_loop().run_until_complete(_send_event("workflow-requests", event))
-        return
-    except Exception:
-        # Fallback: call in-process orchestrator
-        try:
-            from src.orchestrator.celery_tasks import execute_workflow_run
-
-            try:
-                execute_workflow_run.delay(run_id, {"id": str(workflow_id)}, payload)
-            except Exception:
-                execute_workflow_run(run_id, {"id": str(workflow_id)}, payload)
-            return
-        except Exception as err:
-            logger.debug("Fallback orchestrator call failed: %s", err)
+    return submit(
+        _publish(
+            "workflow-requests",
+            event,
+            lambda: _workflow_fallback(run_id, workflow_id, payload),
+        )
+    )
 
 
 def enqueue_agent_run(run_id: str, agent_id: str, payload: dict):
+    """Publish an agent run request without waiting for the broker.
+
+    Returns the future of the publish (including any fallback).
+    """
     event = {
         "type": "agent.run.requested",
         "run_id": run_id,
         "agent_id": str(agent_id),
         "payload": payload,
     }
-
-    try:
-        import asyncio
-
-        asyncio.get_event_loop().run_until_complete(_send_event("agent-requests", event))
-        return
-    except Exception:
-        try:
-            from src.orchestrator.celery_tasks import execute_agent_run
-
-            try:
-                execute_agent_run.delay(run_id, str(agent_id), payload)
-            except Exception:
-                execute_agent_run(run_id, str(agent_id), payload)
-            return
-        except Exception as err:
-            logger.debug("Fallback orchestrator agent call failed: %s", err)
+    return submit(
+        _publish(
+            "agent-requests",
+            event,
+            lambda: _agent_fallback(run_id, agent_id, payload),
+        )
+    )
@@ -50,11 +50,9 @@ class Command(BaseCommand):
 
         for workflow in workflows:
             try:
-                # Parse workflow definition
-                import json
-                try:
-                    workflow_dict = json.loads(workflow.yaml_definition)
-                except json.JSONDecodeError:
+                # Parsed definition is stored alongside the source text
+                workflow_dict = workflow.definition
+                if workflow_dict is None:
                     self.stdout.write(
                         self.style.WARNING(
                             f'Skipping {workflow.name} - invalid JSON definition'
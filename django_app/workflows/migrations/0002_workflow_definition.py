@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:22
+
+import json
+
+from django.db import migrations, models
+
+
+def backfill_definition(apps, schema_editor):
+    Workflow = apps.get_model('workflows', 'Workflow')
+    batch = []
+    for wf in Workflow.objects.only('id', 'yaml_definition').iterator(chunk_size=500):
+        try:
+            wf.definition = json.loads(wf.yaml_definition)
+        except (TypeError, ValueError):
+            continue
+        batch.append(wf)
+        if len(batch) >= 500:
+            Workflow.objects.bulk_update(batch, ['definition'])
+            batch = []
+    if batch:
+        Workflow.objects.bulk_update(batch, ['definition'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflow',
+            name='definition',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_definition, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,35 @@
 from django.db import models
+import json
 import uuid
 
 
+def parse_definition(raw):
+    """Parse a workflow's source text, or return None if it is not JSON."""
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
 class Workflow(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     yaml_definition = models.TextField()
+    # Parsed copy of yaml_definition, kept in sync on save so readers never
+    # re-parse the text; None when the source is not valid JSON
+    definition = models.JSONField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.definition = parse_definition(self.yaml_definition)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "yaml_definition" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "definition"}
+        super().save(*args, **kwargs)
+
 
 class WorkflowRun(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -1,14 +1,16 @@
 from rest_framework import serializers
+from ai_framework.eager_loading import EagerLoadingMixin
 from .models import Workflow, WorkflowRun
 
 
-class WorkflowSerializer(serializers.ModelSerializer):
+class WorkflowSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     class Meta:
         model = Workflow
-        fields = "__all__"
+        # The parsed definition is served by the `definition` action
+        exclude = ("definition",)
 
 
-class WorkflowRunSerializer(serializers.ModelSerializer):
+class WorkflowRunSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     class Meta:
         model = WorkflowRun
         fields = "__all__"
@@ -4,34 +4,46 @@ from rest_framework.response import Response
 from .models import Workflow, WorkflowRun
 from .serializers import WorkflowSerializer, WorkflowRunSerializer
 from .adapters import enqueue_workflow_run
+from ai_framework.compiled_serializers import compile_serializer
+
+_dump_workflow_run = compile_serializer(WorkflowRunSerializer)
 
 
 class WorkflowViewSet(viewsets.ModelViewSet):
     queryset = Workflow.objects.all()
     serializer_class = WorkflowSerializer
 
+    def get_queryset(self):
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset())
+
     @action(detail=True, methods=["post"])
     def start(self, request, pk=None):
         wf = self.get_object()
         payload = request.data.get("input", {})
         run = WorkflowRun.objects.create(workflow=wf, input=payload, status="QUEUED")
         enqueue_workflow_run(str(run.id), str(wf.id), payload)
-        return Response(WorkflowRunSerializer(run).data, status=status.HTTP_201_CREATED)
+        return Response(_dump_workflow_run(run), status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=["get"])
     def definition(self, request, pk=None):
         wf = self.get_object()
-        raw = wf.yaml_definition
-        # Try to parse as JSON first, else return raw
-        try:
-            import json
-
-            parsed = json.loads(raw)
-            return Response(parsed)
-        except Exception:
-            return Response({"yaml_definition": raw})
+        # Parsed on save; fall back to the raw text when it is not JSON
+        if wf.definition is not None:
+            return Response(wf.definition)
+        return Response({"yaml_definition": wf.yaml_definition})
 
 
 class WorkflowRunViewSet(viewsets.ModelViewSet):
     queryset = WorkflowRun.objects.all()
     serializer_class = WorkflowRunSerializer
+
+    def get_queryset(self):
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        # Same output as ListModelMixin.list, via the compiled serializer
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([_dump_workflow_run(run) for run in page])
+        return Response([_dump_workflow_run(run) for run in queryset])
@@ -0,0 +1,68 @@
+"""Compile hot Django request-path modules to C extensions with Cython.
+
+The modules stay ordinary ``.py`` files (Cython's pure-Python mode), so
+nothing changes for environments without a compiler: the build simply places
+``<module>.<abi>.so`` next to each source, and Python's import system prefers
+the extension over the ``.py`` when both exist.
+
+Usage:
+    pip install cython
+    python scripts/cythonize_hot_modules.py          # build in place
+    python scripts/cythonize_hot_modules.py --clean  # remove built extensions
+
+Rebuild after editing any of the listed modules, or run ``--clean`` so the
+stale extension does not shadow the new source.
+"""
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DJANGO_APP = os.path.join(ROOT, "django_app")
+
+# Import names as Django sees them (django_app/ is on sys.path)
+HOT_MODULES = [
+    "authentication.serializers",
+    "monitoring.views",
+]
+
+
+def _source(module):
+    return os.path.join(DJANGO_APP, *module.split(".")) + ".py"
+
+
+def clean():
+    for module in HOT_MODULES:
+        stem = os.path.splitext(_source(module))[0]
+        for path in glob.glob(stem + ".*.so") + glob.glob(stem + ".*.pyd") + [stem + ".c"]:
+            if os.path.exists(path):
+                os.remove(path)
+                print(f"removed {os.path.relpath(path, ROOT)}")
+
+
+def build():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        sys.exit("Cython is not installed: pip install cython")
+    from setuptools import Extension, setup
+
+    extensions = [Extension(module, [_source(module)]) for module in HOT_MODULES]
+    setup(
+        name="ai-framework-hot-modules",
+        package_dir={"": DJANGO_APP},
+        ext_modules=cythonize(
+            extensions,
+            compiler_directives={"language_level": 3},
+            nthreads=os.cpu_count() or 1,
+        ),
+        script_args=["build_ext", "--inplace", "--build-temp", os.path.join(ROOT, "build")],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clean", action="store_true", help="remove built extensions")
+    args = parser.parse_args()
+    clean() if args.clean else build()
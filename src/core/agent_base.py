@@ -208,6 +208,24 @@ class AgentBase(ABC):
                 "agent_name": self.name,
             }
 
+    async def run_batch(
+        self, inputs: List[Any], context: Optional[ExecutionContext] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the agent over a batch of inputs that share one execution context.
+
+        Args:
+            inputs: Input items, processed in order
+            context: Optional execution context reused for every item
+
+        Returns:
+            One execution result per input, as returned by `run`
+        """
+        if context is None:
+            context = ExecutionContext(agent_id=self.id)
+
+        return [await self.run(input_data, context) for input_data in inputs]
+
     async def stop(self) -> None:
         """Stop the agent execution."""
         self.status = AgentStatus.STOPPED
@@ -4,6 +4,10 @@ This module exposes `get_producer` and `get_consumer` factories that
 return an object with `send(topic, value)` / `consume()` methods. The
 real backend uses `aiokafka` (optional), while tests can use the
 `InMemoryBroker` class.
+
+Producers also offer `enqueue(topic, value)` / `flush()` for high-volume
+streams: `enqueue` hands the message to the producer's batch without
+waiting for delivery, and `flush` waits for everything queued so far.
 """
 from __future__ import annotations
 
@@ -40,6 +44,12 @@ class InMemoryBroker:
                 q = broker._get_queue(topic)
                 await q.put(value)
 
+            async def enqueue(self, topic: str, value: Any) -> None:
+                broker._get_queue(topic).put_nowait(value)
+
+            async def flush(self) -> None:
+                return None
+
         return Producer()
 
     def create_consumer(self, topic: str):
@@ -61,17 +71,40 @@ class InMemoryBroker:
 try:
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer  # type: ignore
 
-    async def create_aiokafka_producer(bootstrap_servers: str):
-        prod = AIOKafkaProducer(bootstrap_servers=bootstrap_servers)
+    # Let the producer coalesce messages into batches instead of one
+    # request per message; callers can override any of these.
+    PRODUCER_DEFAULTS: Dict[str, Any] = {
+        "acks": 1,
+        "linger_ms": 10,
+        "max_batch_size": 65536,
+    }
+
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, (dict, list)):
+            return json.dumps(value).encode("utf-8")
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return value
+
+    async def create_aiokafka_producer(bootstrap_servers: str, **config: Any):
+        prod = AIOKafkaProducer(
+            bootstrap_servers=bootstrap_servers, **{**PRODUCER_DEFAULTS, **config}
+        )
         await prod.start()
 
         class Producer:
             async def send(self, topic: str, value: Any):
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value).encode("utf-8")
-                elif isinstance(value, str):
-                    value = value.encode("utf-8")
-                await prod.send_and_wait(topic, value)
+                await prod.send_and_wait(topic, _encode(value))
+
+            async def enqueue(self, topic: str, value: Any) -> asyncio.Future:
+                """Add a message to the current batch; returns its delivery future."""
+                return await prod.send(topic, _encode(value))
+
+            async def flush(self) -> None:
+                await prod.flush()
+
+            async def stop(self) -> None:
+                await prod.stop()
 
         return Producer()
 
@@ -112,7 +145,8 @@ async def get_producer(backend: str = "inmemory", **kwargs):
     if backend == "aiokafka":
         if not AIOKAFKA_AVAILABLE:
             raise RuntimeError("aiokafka not installed")
-        return await create_aiokafka_producer(kwargs.get("bootstrap_servers"))
+        bootstrap_servers = kwargs.pop("bootstrap_servers", None)
+        return await create_aiokafka_producer(bootstrap_servers, **kwargs)
     return get_inmemory_broker().create_producer()
 
 
@@ -0,0 +1,87 @@
+"""Numeric kernels for the streaming and data analysis agents.
+
+The loop implementations are compiled with Numba when it is installed;
+otherwise the equivalent NumPy reductions are used.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _loop_window_zscore(window: np.ndarray, value: float) -> float:
+    """Return |value - mean| / std over `window`, or 0.0 when std is zero.
+
+    Uses the population standard deviation, matching `ndarray.std()`.
+    """
+    n = window.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += window[i]
+    mean = total / n
+
+    sq = 0.0
+    for i in range(n):
+        d = window[i] - mean
+        sq += d * d
+    std = math.sqrt(sq / n)
+
+    if std == 0.0:
+        return 0.0
+    return abs(value - mean) / std
+
+
+def _np_window_zscore(window: np.ndarray, value: float) -> float:
+    """NumPy equivalent of `_loop_window_zscore` for use without Numba."""
+    mean = float(window.mean(dtype=np.float64))
+    std = float(window.std(dtype=np.float64))
+    if std == 0.0:
+        return 0.0
+    return abs(value - mean) / std
+
+
+if njit is not None:
+    window_zscore = njit(cache=True)(_loop_window_zscore)
+    # Compile (or load from cache) at import rather than on the first reading
+    window_zscore(np.zeros(2, dtype=np.float32), 0.0)
+else:
+    window_zscore = _np_window_zscore
+
+
+def _loop_outside_counts(values: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Count, per column j, the values below `lower[j]` or above `upper[j]`.
+
+    NaN values and NaN bounds never count. Columns are processed in
+    parallel, so `values` is best passed column-major.
+    """
+    n, m = values.shape
+    counts = np.zeros(m, dtype=np.int64)
+    for j in prange(m):
+        lo = lower[j]
+        hi = upper[j]
+        c = 0
+        for i in range(n):
+            v = values[i, j]
+            if v < lo or v > hi:
+                c += 1
+        counts[j] = c
+    return counts
+
+
+def _np_outside_counts(values: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """NumPy equivalent of `_loop_outside_counts` for use without Numba."""
+    return ((values < lower) | (values > upper)).sum(axis=0)
+
+
+if njit is not None:
+    # No fastmath: it would let the compiler assume there are no NaNs
+    outside_counts = njit(parallel=True, cache=True)(_loop_outside_counts)
+    outside_counts(np.zeros((2, 1), dtype=np.float64, order="F"), np.zeros(1), np.zeros(1))
+else:
+    outside_counts = _np_outside_counts
@@ -103,12 +103,9 @@ def execute_workflow_run(run_id: str, workflow_def: dict, payload: dict):
 
                 wf_model = DjangoWorkflow.objects.filter(id=wf_id).first()
                 if wf_model:
-                    # Attempt to parse YAML or JSON from yaml_definition
-                    import json
-
-                    try:
-                        defn = json.loads(wf_model.yaml_definition)
-                    except Exception:
+                    # Parsed JSON copy of yaml_definition, None if not JSON
+                    defn = wf_model.definition
+                    if defn is None:
                         # Fall back to a minimal wrapper
                         defn = {
                             "id": str(wf_model.id),
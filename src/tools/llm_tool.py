@@ -2,6 +2,8 @@
 LLM tool for language model interactions and text generation.
 """
 
+import asyncio
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
@@ -55,6 +57,7 @@ class LLMTool(ToolBase):
         max_tokens: int = 1000,
         temperature: float = 0.7,
         timeout: int = 30,
+        ov_int8: bool = False,
         **kwargs,
     ):
         """
@@ -68,6 +71,9 @@ class LLMTool(ToolBase):
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             timeout: Request timeout in seconds
+            ov_int8: Run `model_name` (a Hugging Face model id or exported
+                OpenVINO directory) locally through OpenVINO with INT8
+                weights; needs optimum-intel
             **kwargs: Additional configuration
         """
         super().__init__(
@@ -83,6 +89,11 @@ class LLMTool(ToolBase):
         self.base_url = base_url
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.ov_int8 = ov_int8
+
+        # Local OpenVINO (tokenizer, model), loaded on first use
+        self._ov_model = None
+        self._ov_model_lock = asyncio.Lock()
 
         # Statistics
         self.total_tokens_used = 0
@@ -95,6 +106,7 @@ class LLMTool(ToolBase):
             "base_url": base_url,
             "max_tokens": max_tokens,
             "temperature": temperature,
+            "ov_int8": ov_int8,
         }
 
     async def _execute_tool(
@@ -143,6 +155,10 @@ class LLMTool(ToolBase):
     ) -> LLMResponse:
         """Generate response from LLM."""
         try:
+            # A local OpenVINO model is an explicit per-tool choice
+            if self.ov_int8:
+                return await self._call_openvino(request)
+
             # Prefer provider selected via environment/configuration
             import os
 
@@ -255,6 +271,54 @@ class LLMTool(ToolBase):
             metadata={"provider": "local_llama"},
         )
 
+    def _load_openvino_model(self):
+        """Load the tokenizer and an OpenVINO model with INT8-compressed weights."""
+        from optimum.intel import OVModelForCausalLM
+        from transformers import AutoTokenizer
+
+        # Hugging Face checkpoints are converted to OpenVINO IR on load;
+        # load_in_8bit compresses the weights to INT8 with NNCF
+        export = not (Path(self.model_name) / "openvino_model.xml").exists()
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = OVModelForCausalLM.from_pretrained(
+            self.model_name, export=export, load_in_8bit=True
+        )
+        return tokenizer, model
+
+    async def _call_openvino(self, request: LLMRequest) -> LLMResponse:
+        """Generate with a local INT8 OpenVINO model (CPU inference)."""
+        self.logger.info(f"Calling OpenVINO INT8 model {self.model_name}")
+
+        async with self._ov_model_lock:
+            if self._ov_model is None:
+                self._ov_model = await asyncio.to_thread(self._load_openvino_model)
+        tokenizer, model = self._ov_model
+
+        max_tokens = request.max_tokens or self.max_tokens
+        temperature = request.temperature or self.temperature
+
+        def generate():
+            inputs = tokenizer(request.prompt, return_tensors="pt")
+            output = model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                do_sample=temperature > 0,
+                temperature=temperature,
+            )
+            new_tokens = output[0][inputs["input_ids"].shape[1]:]
+            return tokenizer.decode(new_tokens, skip_special_tokens=True), len(new_tokens)
+
+        # Inference is CPU-bound; keep it off the event loop
+        response_text, tokens_used = await asyncio.to_thread(generate)
+
+        return LLMResponse(
+            text=response_text,
+            model=self.model_name,
+            tokens_used=tokens_used,
+            finish_reason="length" if tokens_used >= max_tokens else "stop",
+            metadata={"provider": "openvino", "weight_format": "int8"},
+        )
+
     async def _call_generic_api(self, request: LLMRequest) -> LLMResponse:
         """Call generic LLM API (stub implementation)."""
         self.logger.info(f"Calling generic API with model {self.model_name}")
@@ -273,8 +337,6 @@ class LLMTool(ToolBase):
 
     async def _simulate_api_delay(self) -> None:
         """Simulate API call delay."""
-        import asyncio
-
         await asyncio.sleep(0.1)  # Simulate 100ms API delay
 
     def generate(self, prompt: str) -> Dict[str, str]:
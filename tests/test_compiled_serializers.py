@@ -0,0 +1,42 @@
+from django.apps import apps
+from django.test import TestCase
+
+from ai_framework.compiled_serializers import compile_serializer
+
+
+class CompiledSerializerTest(TestCase):
+    def test_matches_drf_workflow_run_representation(self):
+        from workflows.serializers import WorkflowRunSerializer
+
+        Workflow = apps.get_model("workflows", "Workflow")
+        WorkflowRun = apps.get_model("workflows", "WorkflowRun")
+        wf = Workflow.objects.create(name="wf", yaml_definition="{}")
+        run = WorkflowRun.objects.create(workflow=wf, input={"x": 1}, result=None)
+
+        dump = compile_serializer(WorkflowRunSerializer)
+        self.assertEqual(dump(run), WorkflowRunSerializer(run).data)
+
+    def test_matches_drf_user_representation_with_method_field(self):
+        from authentication.serializers import UserSerializer
+
+        User = apps.get_model("authentication", "CustomUser")
+        user = User.objects.create_user(
+            username="u@example.com", email="u@example.com", password="pw-12345-xyz"
+        )
+
+        dump = compile_serializer(UserSerializer)
+        self.assertEqual(dump(user), UserSerializer(user).data)
+
+    def test_user_serializer_uses_compiled_representation(self):
+        from rest_framework import serializers
+        from authentication.serializers import UserSerializer
+
+        User = apps.get_model("authentication", "CustomUser")
+        user = User.objects.create_user(
+            username="c@example.com", email="c@example.com", password="pw-12345-xyz"
+        )
+
+        serializer = UserSerializer(user)
+        expected = serializers.ModelSerializer.to_representation(serializer, user)
+        self.assertEqual(serializer.data, expected)
+        self.assertIn("_compiled_dump", UserSerializer.__dict__)
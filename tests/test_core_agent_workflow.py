@@ -20,6 +20,17 @@ def test_simple_agent_run_sync():
     assert res["output"]["echo"] == "hello"
 
 
+def test_simple_agent_run_batch_preserves_order():
+    agent = SimpleAgent(
+        name="batch_echo_agent", processor_func=lambda inp, ctx: {"echo": inp}
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    results = loop.run_until_complete(agent.run_batch(["a", "b", "c"]))
+    assert [r["output"]["echo"] for r in results] == ["a", "b", "c"]
+    assert agent.execution_count == 3
+
+
 def test_simple_dag_workflow_execution():
     # Two-step workflow where step1 produces output consumed by step2
     def step1_func(inp, ctx):
@@ -70,4 +81,5 @@ def test_simple_dag_workflow_execution():
 
 if __name__ == "__main__":
     test_simple_agent_run_sync()
+    test_simple_agent_run_batch_preserves_order()
     test_simple_dag_workflow_execution()
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+agent_module = pytest.importorskip("reference_agents.data_analysis_agent")
+
+
+def test_downcast_accepts_integer_column_labels():
+    agent = agent_module.DataAnalysisAgent()
+    values = np.random.default_rng(0).normal(size=(100, 3))
+
+    df = agent._prepare_data(values, {"downcast": True})
+
+    assert list(df.columns) == [0, 1, 2]
+    assert (df.dtypes == np.float32).all()
+    np.testing.assert_allclose(df.to_numpy(), values, rtol=1e-6)
+
+
+def test_result_cache_skips_failed_analyses():
+    cache = agent_module.AnalysisResultCache()
+    request = {"data": pd.DataFrame({"x": [1.0, 2.0]}), "analysis_type": "comprehensive"}
+    failed = {"status": "completed", "output": {"error": "Analysis failed: boom", "analysis_result": None}}
+    succeeded = {"status": "completed", "output": {"analysis_result": {"insights": []}}}
+
+    cache.put(request, failed)
+    assert cache.get(request) is None
+
+    cache.put(request, succeeded)
+    assert cache.get(request) is succeeded
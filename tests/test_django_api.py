@@ -1,2 +1,121 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from authentication import password_hashing
+from authentication.models import CustomUser
+
+
 def test_dummy():
     assert True
+
+
+@override_settings(PASSWORD_HASHING_EAGER=True)
+class BackgroundPasswordHashingTest(TestCase):
+    password = "first-Pass-123"
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def post_registration(self):
+        response = self.client.post("/api/auth/register/", {
+            "email": "ada@example.com",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "password": self.password,
+            "confirm_password": self.password,
+        }, format="json")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["password_status"], "pending")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {response.data['token']}")
+        return response
+
+    def register(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.post_registration()
+
+    def login(self, password):
+        return APIClient().post("/api/auth/login/", {
+            "email": "ada@example.com", "password": password
+        }, format="json")
+
+    def test_registration_password_is_usable_after_commit(self):
+        self.register()
+
+        self.assertEqual(self.client.get("/api/auth/password-status/").data,
+                         {"password_status": "set"})
+        self.assertEqual(self.login(self.password).status_code, 200)
+
+    def test_change_password_returns_202_and_new_password_logs_in(self):
+        self.register()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/auth/change-password/", {
+                "old_password": self.password, "new_password": "second-Pass-456"
+            }, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["password_status"], "pending")
+        self.assertEqual(self.login("second-Pass-456").status_code, 200)
+        self.assertEqual(self.login(self.password).status_code, 400)
+
+    def test_change_is_refused_while_another_is_pending(self):
+        self.register()
+
+        # Without executing on_commit callbacks the first change stays pending
+        with self.captureOnCommitCallbacks(execute=False):
+            first = self.client.post("/api/auth/change-password/", {
+                "old_password": self.password, "new_password": "second-Pass-456"
+            }, format="json")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {first.data['token']}")
+        second = self.client.post("/api/auth/change-password/", {
+            "old_password": self.password, "new_password": "third-Pass-789"
+        }, format="json")
+
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(second.status_code, 409)
+        # The old password still works until the pending hash is stored
+        self.assertEqual(self.login(self.password).status_code, 200)
+
+    def test_stale_job_does_not_overwrite_newer_password(self):
+        self.register()
+        user = CustomUser.objects.get(email="ada@example.com")
+        version = user.password_version
+
+        password_hashing._store_hash(user.pk, "newer-Pass-000", version)
+        self.assertFalse(password_hashing._store_hash(user.pk, "older-Pass-000", version - 1))
+
+        self.assertEqual(self.login("newer-Pass-000").status_code, 200)
+
+    def test_hashing_failure_is_recorded_and_recoverable(self):
+        with mock.patch.object(password_hashing, "make_password",
+                               side_effect=RuntimeError("hasher down")):
+            with self.assertRaises(RuntimeError):
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.post_registration()
+
+        self.assertEqual(self.client.get("/api/auth/password-status/").data,
+                         {"password_status": "failed"})
+
+        # The account never got a usable password, so one can be set without
+        # the old one
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/auth/change-password/", {
+                "new_password": "second-Pass-456"
+            }, format="json")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.login("second-Pass-456").status_code, 200)
+
+    def test_disabled_password_still_requires_old_password(self):
+        self.register()
+        user = CustomUser.objects.get(email="ada@example.com")
+        user.set_unusable_password()
+        user.save()
+
+        response = self.client.post("/api/auth/change-password/", {
+            "new_password": "second-Pass-456"
+        }, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.login("second-Pass-456").status_code, 400)
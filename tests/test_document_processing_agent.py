@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.execution_context import ExecutionContext
+from reference_agents import document_processing_agent as doc_module
+
+
+class FakeLLMTool:
+    async def generate_async(self, prompt, context):
+        return SimpleNamespace(text="SUMMARY: A short note.\nKEY POINTS:\n- one\nTOPICS: notes")
+
+
+@pytest.fixture
+def agent():
+    agent = doc_module.DocumentProcessingAgent()
+    agent.llm_tool = FakeLLMTool()
+    return agent
+
+
+async def test_identical_documents_are_served_from_cache(agent, tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    for path in (first, second):
+        path.write_text("Quarterly report. Revenue grew in every region.")
+
+    cached = await agent.execute(str(first), ExecutionContext())
+    replayed = await agent.execute(str(second), ExecutionContext())
+
+    assert agent.cache_hits == 1
+    assert replayed["extracted_text"] == cached["extracted_text"]
+    assert replayed["metadata"]["source"] == str(second)
+    assert replayed["agent_info"]["processing_timestamp"] >= cached["agent_info"]["processing_timestamp"]
+
+
+async def test_failed_extraction_is_not_cached(agent, tmp_path, monkeypatch):
+    def broken_read(pdf_content):
+        raise RuntimeError("corrupt PDF")
+
+    monkeypatch.setattr(doc_module, "PYMUPDF_AVAILABLE", True)
+    monkeypatch.setattr(doc_module, "_read_pdf", broken_read)
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(b"%PDF-1.4 not really")
+
+    await agent.execute(str(path), ExecutionContext())
+    await agent.execute(str(path), ExecutionContext())
+
+    assert agent.cache_hits == 0
+    assert agent.processing_errors == 2
+    assert not agent.document_cache
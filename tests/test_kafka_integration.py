@@ -46,3 +46,20 @@ def test_workflow_request_triggers_orchestrator(monkeypatch):
     assert calls[0]["run_id"] == run_id
     assert calls[0]["workflow_id"] == workflow_id
     assert calls[0]["payload"] == {"foo": "bar"}
+
+
+def test_inmemory_producer_enqueue_then_flush():
+    from src.messaging.kafka_client import InMemoryBroker
+
+    broker = InMemoryBroker()
+
+    async def main():
+        prod = broker.create_producer()
+        for i in range(3):
+            await prod.enqueue("batched", {"i": i})
+        await prod.flush()
+
+        cons = broker.create_consumer("batched")
+        return [await cons.__anext__() for _ in range(3)]
+
+    assert asyncio.run(main()) == [{"i": 0}, {"i": 1}, {"i": 2}]
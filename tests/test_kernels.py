@@ -0,0 +1,36 @@
+import numpy as np
+
+from src.optimizations.kernels import (
+    _loop_outside_counts,
+    _loop_window_zscore,
+    _np_outside_counts,
+    _np_window_zscore,
+    outside_counts,
+    window_zscore,
+)
+
+
+def test_window_zscore_loop_matches_numpy():
+    rng = np.random.default_rng(0)
+    window = rng.normal(25.0, 3.0, 50).astype(np.float32)
+
+    expected = _np_window_zscore(window, 31.0)
+    assert abs(_loop_window_zscore(window, 31.0) - expected) < 1e-4
+    assert abs(window_zscore(window, 31.0) - expected) < 1e-4
+
+
+def test_window_zscore_constant_window_is_zero():
+    assert window_zscore(np.full(10, 20.0, dtype=np.float32), 25.0) == 0.0
+
+
+def test_outside_counts_loop_matches_numpy():
+    rng = np.random.default_rng(1)
+    values = np.asfortranarray(rng.normal(0.0, 1.0, (200, 4)))
+    values[3, 1] = np.nan
+    lower = np.array([-1.0, -2.0, np.nan, -0.5])
+    upper = np.array([1.0, 2.0, np.nan, 0.5])
+
+    expected = _np_outside_counts(values, lower, upper)
+    assert expected[2] == 0  # NaN bounds never count
+    np.testing.assert_array_equal(_loop_outside_counts(values, lower, upper), expected)
+    np.testing.assert_array_equal(outside_counts(values, lower, upper), expected)
@@ -0,0 +1,19 @@
+from django.test import TestCase
+
+from monitoring.buffers import MetricBuffer
+from monitoring.models import MetricSample
+
+
+class MetricBufferTest(TestCase):
+    def test_flush_writes_recorded_samples_in_bulk(self):
+        buffer = MetricBuffer(flush_interval=3600)
+        buffer.record("latency_ms", 12.5, {"route": "/api"})
+        buffer.record("latency_ms", 7.0)
+        self.assertEqual(MetricSample.objects.count(), 0)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(
+            sorted(MetricSample.objects.values_list("value", flat=True)), [7.0, 12.5]
+        )
+        self.assertEqual(buffer.flush(), 0)
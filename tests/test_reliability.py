@@ -34,7 +34,8 @@ def test_adapter_falls_back_to_orchestrator(monkeypatch):
     from django_app.workflows.adapters import enqueue_workflow_run
 
     run_id = str(uuid.uuid4())
-    enqueue_workflow_run(run_id, "wf1", {"a": 1})
+    # Publishing is fire-and-forget; wait for the publish (and fallback) to finish
+    enqueue_workflow_run(run_id, "wf1", {"a": 1}).result(timeout=5)
 
     assert len(calls) == 1
     assert calls[0][0] == run_id
@@ -80,3 +81,43 @@ def test_worker_continues_after_handler_exception(monkeypatch):
     asyncio.run(main())
 
     assert "r2" in processed
+
+
+def test_adapter_shares_one_producer_and_stops_it_on_failure(monkeypatch):
+    """Concurrent publishes create one producer; a failed send stops it."""
+    from django_app.workflows import adapters
+
+    created = []
+
+    class FlakyProducer:
+        stopped = False
+
+        async def send(self, topic, value):
+            await asyncio.sleep(0)
+            if value.get("bad"):
+                raise RuntimeError("broker down")
+
+        async def stop(self):
+            self.stopped = True
+
+    async def fake_get_producer(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        created.append(FlakyProducer())
+        return created[-1]
+
+    monkeypatch.setattr(adapters, "get_producer", fake_get_producer)
+    monkeypatch.setattr(adapters, "_producer", None)
+    monkeypatch.setattr(adapters, "_producer_lock", None)
+
+    async def main():
+        await asyncio.gather(*(adapters._send_event("t", {"n": n}) for n in range(5)))
+        try:
+            await adapters._send_event("t", {"bad": True})
+        except RuntimeError:
+            pass
+
+    asyncio.run(main())
+
+    assert len(created) == 1
+    assert created[0].stopped
+    assert adapters._producer is None